@@ -0,0 +1,58 @@
+"""
+Compare the memory use and push speed of ArrayPad's cell dtype options.
+
+A large pad is filled with text and scrolled through one row per frame; each frame copies the visible region of the
+pad into the widget's buffer and pushes it to the widget's window.
+
+Usage:
+    python benchmarks/cell_benchmark.py [frames]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+from nurses import ScreenManager
+from nurses.backends import HeadlessBackend
+from nurses.widgets import ArrayPad
+
+ROWS, COLS = 10_000, 500
+HEIGHT, WIDTH = 60, 200
+FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+TEXT = "The quick brown fox jumps over the lazy dog. "
+
+OPTIONS = {
+    "U1, int": { },
+    "uint32, uint16": dict(char_dtype=np.uint32, color_dtype=np.uint16),
+    "uint32, uint16, packed": dict(char_dtype=np.uint32, color_dtype=np.uint16, packed=True),
+    "uint8, uint16": dict(char_dtype=np.uint8, color_dtype=np.uint16),
+    "uint8, uint16, packed": dict(char_dtype=np.uint8, color_dtype=np.uint16, packed=True),
+}
+
+
+def bench(sm, options):
+    pad = sm.root.new_widget(0, 0, HEIGHT, WIDTH, create_with=ArrayPad, rows=ROWS, cols=COLS, **options)
+    line = (TEXT * (COLS // len(TEXT) + 1))[:COLS]
+    pad[:] = np.array(tuple(line))
+    pad.pad_colors[::3] = 256
+
+    cells = pad.pad.base if options.get("packed") else pad.pad
+    nbytes = cells.nbytes if options.get("packed") else pad.pad.nbytes + pad.pad_colors.nbytes
+
+    start = perf_counter()
+    for i in range(FRAMES):
+        pad.min_row = i
+        pad.push()
+    elapsed = perf_counter() - start
+
+    sm.root.remove_widget(pad)
+    return nbytes / 2**20, elapsed / FRAMES * 1000
+
+
+if __name__ == "__main__":
+    sm = ScreenManager(backend=HeadlessBackend(HEIGHT, WIDTH + 1))
+
+    print(f"{ROWS}x{COLS} pad, {HEIGHT}x{WIDTH} view, {FRAMES} frames")
+    print(f"{'char, color dtypes':<26}{'MiB':>8}{'ms/push':>10}")
+    for name, options in OPTIONS.items():
+        mib, ms = bench(sm, options)
+        print(f"{name:<26}{mib:>8.1f}{ms:>10.3f}")
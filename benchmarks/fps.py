@@ -0,0 +1,221 @@
+"""
+End-to-end frame benchmark built from the shipped examples.
+
+Each example runs headless in its own process for a fixed number of frames with scripted input. The scheduler runs
+on a virtual clock: every frame advances it by `FRAME_TIME` and it jumps straight to the next deadline (or scripted key)
+whenever the loop would otherwise idle, so runs are deterministic and as fast as the cpu allows.  Scripts are indexed
+by step, the number of `FRAME_TIME`s that have passed on the virtual clock.  Reported per example:
+
+    cpu_seconds         cpu time of the process spent running the example (`time.process_time`)
+    fps                 frames / cpu_seconds
+    frame_ms_p50/p99    wall time between consecutive frames
+    peak_rss_kib        peak resident memory of the process
+
+Usage:
+    python benchmarks/fps.py [--frames N] [--output results.json] [example ...]
+
+Results are printed as a table and, with `--output`, written as json so runs of different commits can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+from time import perf_counter, process_time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES_DIR = os.path.join(ROOT, "examples")
+
+HEIGHT, WIDTH = 40, 120
+FRAME_TIME = 1 / 60  # Virtual seconds that pass each frame
+MAX_STEPS = 20       # Give up after `MAX_STEPS * frames` steps if an example stops drawing frames
+
+TYPED = "The quick brown fox jumps over the lazy dog.\n"
+UP, DOWN, LEFT, RIGHT = 259, 258, 260, 261
+
+
+def exploding_logo_keys(step):
+    if step % 60 == 5:
+        return " "  # Poke
+    if step % 60 == 50:
+        return "r"  # Reset
+    return (UP, LEFT, DOWN, RIGHT)[step // 15 % 4] if step % 15 == 0 else ()
+
+
+def typing_keys(step):
+    return TYPED[step % len(TYPED)]
+
+
+def behaviors_test_keys(step):
+    return 0 if step == 0 else typing_keys(step)  # Select the notepad, then type into it
+
+
+def no_keys(step):
+    return ()
+
+
+def as_tuple(keys):
+    return keys if isinstance(keys, (tuple, str)) else (keys,)
+
+
+EXAMPLES = {
+    "exploding_logo": exploding_logo_keys,
+    "code_rain_logo": no_keys,
+    "async_test": no_keys,
+    "behaviors_test": behaviors_test_keys,
+    "textpad_test": typing_keys,
+}
+
+
+class StopBenchmark(Exception):
+    ...
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += max(delay, 0)
+
+
+def run_example(name, frames):
+    """Run one example in this process and return its measurements."""
+    import nurses.managers.scheduler as scheduler
+    from nurses import ScreenManager
+    from nurses.backends import HeadlessBackend
+
+    clock = VirtualClock()
+    scheduler.monotonic, scheduler.sleep = clock.monotonic, clock.sleep
+
+    script = EXAMPLES[name]
+    times = [ ]
+
+    class BenchmarkBackend(HeadlessBackend):
+        step = 0  # Next step of the script to feed
+
+        def present(self, window):
+            times.append(perf_counter())
+            super().present(window)
+
+            if self.frames == frames:
+                raise StopBenchmark
+
+            clock.sleep(FRAME_TIME)
+
+        def getch(self):
+            if not self.keys and not sm.ready:  # Nothing to do until the next deadline or scripted key; skip ahead.
+                next_step = self.step * FRAME_TIME
+                deadline = sm.sleeping.next_deadline()
+                clock.now = max(clock.now, next_step if deadline is None else min(deadline, next_step))
+
+            while self.step * FRAME_TIME <= clock.now:
+                self.feed(*as_tuple(script(self.step)))
+                self.step += 1
+
+            if self.step > MAX_STEPS * frames:
+                raise StopBenchmark
+
+            return super().getch()
+
+    sm = ScreenManager(backend=BenchmarkBackend(HEIGHT, WIDTH))
+    sm.fps = float("inf")  # Don't cap the frame rate; a frame is drawn as soon as one is requested.
+
+    sys.argv = [name]
+    os.chdir(EXAMPLES_DIR)
+    start = process_time()
+    try:
+        runpy.run_path(os.path.join(EXAMPLES_DIR, f"{name}.py"), run_name="__main__")
+    except StopBenchmark:
+        pass
+    elapsed = process_time() - start
+
+    intervals = np.diff(times) * 1000
+
+    try:
+        import resource
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:  # Not available on windows
+        peak_rss = None
+
+    return {
+        "example": name,
+        "frames": len(times),
+        "completed": len(times) == frames,
+        "cpu_seconds": round(elapsed, 4),
+        "fps": round(len(times) / elapsed, 2),
+        "frame_ms_p50": round(float(np.percentile(intervals, 50)), 3) if len(intervals) else None,
+        "frame_ms_p99": round(float(np.percentile(intervals, 99)), 3) if len(intervals) else None,
+        "peak_rss_kib": peak_rss,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "--short", "HEAD"), cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("examples", nargs="*", choices=[[], *EXAMPLES], default=[ ], metavar="example")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--output", help="write results as json to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # Suppress anything the example prints so stdout only carries the result.
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            result = run_example(args.child, args.frames)
+            sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH")))))
+    results = [ ]
+    for name in args.examples or EXAMPLES:
+        process = subprocess.run(
+            (sys.executable, __file__, "--child", name, "--frames", str(args.frames)),
+            capture_output=True, text=True, env=env,
+        )
+        if process.returncode:
+            results.append({"example": name, "error": process.stderr.strip().splitlines()[-1:]})
+        else:
+            results.append(json.loads(process.stdout.splitlines()[-1]))
+
+    print(f"{'example':<16}{'frames':>8}{'fps':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>10}")
+    for result in results:
+        if "error" in result:
+            print(f"{result['example']:<16} error: {' '.join(result['error'])}")
+        else:
+            print(
+                f"{result['example']:<16}{result['frames']:>8}{result['fps']:>10}"
+                f"{result['frame_ms_p50']:>10}{result['frame_ms_p99']:>10}{result['peak_rss_kib']:>10}"
+            )
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "frames": args.frames,
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Measure Observable throughput with compiled per-class dispatch tables against the old dispatch, which looked callbacks up
+by class name and called `getattr(instance, name)()` for each on every set, and kept getters in a plain dict.
+
+Four cases are reported, in operations per second:
+
+    widget      setting `top` and `left` of a widget in a tree (pos hints, redraw requests and the parent's spatial index
+                are bound to them)
+    dispatch    setting an Observable with three no-op methods bound, so only the cost of dispatching is measured
+    unbound     setting an Observable that no class binds methods to
+    getter      reading `top` of a widget with a getter registered (see `Widget.getter`)
+
+Usage:
+    python benchmarks/observable_benchmark.py [operations]
+"""
+import sys
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+from nurses import ScreenManager
+from nurses.backends import HeadlessBackend
+from nurses.observable import Observable
+from nurses.widgets import Widget
+
+OPERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+REPEATS = 5
+
+
+def legacy_set(self, instance, value):
+    instance.__dict__[self.name] = value
+    legacy_dispatch(self, instance)
+
+
+def legacy_get(self, instance, owner):
+    if instance is None:
+        return self
+
+    if instance in self.getters:
+        return self.getters[instance]()
+
+    if self.name in instance.__dict__:
+        return instance.__dict__[self.name]
+
+    return self.default
+
+
+def legacy_dispatch(self, instance):
+    name = type(instance).__name__
+    if name not in self.callbacks:
+        d = { }
+        for base in reversed(type(instance).__mro__):
+            d.update(self.methods.get(base, { }))
+        self.callbacks[name] = list(d)
+
+    for callback in self.callbacks[name]:
+        getattr(instance, callback)()
+
+
+COMPILED = Observable.__set__, Observable.__get__, Observable.dispatch
+LEGACY = legacy_set, legacy_get, legacy_dispatch
+
+
+class Bound:
+    value = Observable(0)
+
+    def a(self):
+        pass
+
+    def b(self):
+        pass
+
+    def c(self):
+        pass
+
+
+class Unbound:
+    value = Observable(0)
+
+
+Bound.value.__set_name__(Bound, "value")
+Unbound.value.__set_name__(Unbound, "value")
+for method in "abc":
+    Bound.value.bind(Bound, method)
+
+
+def use_legacy(legacy):
+    Observable.__set__, Observable.__get__, Observable.dispatch = LEGACY if legacy else COMPILED
+    for observable in (Widget.top, Widget.left, Bound.value, Unbound.value):
+        observable.callbacks = { }
+        observable.getters = { } if legacy else WeakKeyDictionary()
+
+
+def bench_widget():
+    parent = ScreenManager().root.new_widget(0, 0, 100, 100)
+    widget = parent.new_widget(0, 0, 10, 10)
+
+    start = perf_counter()
+    for i in range(OPERATIONS // 2):
+        widget.top = i % 50
+        widget.left = i % 50
+
+    return OPERATIONS / (perf_counter() - start)
+
+
+def bench_set(cls):
+    instance = cls()
+
+    start = perf_counter()
+    for i in range(OPERATIONS):
+        instance.value = i
+
+    return OPERATIONS / (perf_counter() - start)
+
+
+def bench_getter():
+    widget = ScreenManager().root.new_widget(0, 0, 10, 10)
+    widget.getter("top", lambda: 5)
+
+    start = perf_counter()
+    for _ in range(OPERATIONS):
+        widget.top
+
+    return OPERATIONS / (perf_counter() - start)
+
+
+def bench_all():
+    return bench_widget(), bench_set(Bound), bench_set(Unbound), bench_getter()
+
+
+if __name__ == "__main__":
+    ScreenManager(backend=HeadlessBackend(100, 100))
+
+    best = {True: [0] * 4, False: [0] * 4}  # Best of `REPEATS` runs, alternating between legacy and compiled
+    for _ in range(REPEATS):
+        for legacy in best:
+            use_legacy(legacy)
+            best[legacy] = list(map(max, best[legacy], bench_all()))
+    use_legacy(False)
+
+    print(f"{OPERATIONS} operations per case, best of {REPEATS}")
+    print(f"{'case':<10}{'legacy /s':>14}{'compiled /s':>14}{'speedup':>10}")
+    for case, old, new in zip(("widget", "dispatch", "unbound", "getter"), best[True], best[False]):
+        print(f"{case:<10}{old:>14,.0f}{new:>14,.0f}{new / old:>10.2f}")
@@ -0,0 +1,92 @@
+"""
+Compare `CursesBackend.present` against the old per-cell `np.nditer` push loop.
+
+Both write to a screen that only counts `addstr` calls, so the timings measure the python-side cost of a frame;
+with a real curses screen every saved `addstr` call saves considerably more.
+
+Usage:
+    python benchmarks/push_benchmark.py [frames]
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+from nurses.backends import CursesBackend
+from nurses.window import Window
+
+HEIGHT, WIDTH = 60, 200
+FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+CHANGED = .02  # Fraction of cells changed each frame in the "sparse" scenario
+TEXT = "The quick brown fox jumps over the lazy dog. "
+
+
+class CountingScreen:
+    def __init__(self):
+        self.calls = 0
+
+    def addstr(self, y, x, text, color):
+        self.calls += 1
+
+    def refresh(self):
+        pass
+
+
+class CountingBackend(CursesBackend):
+    def __init__(self):  # Don't start curses
+        self.screen = CountingScreen()
+        self._presented = None
+
+
+def per_cell_push(backend, window):
+    """The push loop ArrayWin used before diffing and run-length batching."""
+    it = np.nditer((window.chars, window.colors), ["multi_index"])
+    for char, color in it:
+        if (ch := str(char)) == "\n":
+            ch = " "
+
+        y, x = it.multi_index
+        backend.screen.addstr(y, x, ch, color)
+
+
+def new_window():
+    window = Window(HEIGHT, WIDTH)
+    text = (TEXT * (HEIGHT * WIDTH // len(TEXT) + 1))[:HEIGHT * WIDTH]
+    window.chars[:] = np.array(tuple(text)).reshape(HEIGHT, WIDTH)
+    window.colors[:, 40:80] = 256  # A couple of colored columns so rows split into several runs
+    window.colors[::3, 120:] = 512
+    return window
+
+
+def full_change(window, rng):
+    window.chars[:] = np.roll(window.chars, 1, axis=1)
+
+
+def sparse_change(window, rng):
+    n = int(HEIGHT * WIDTH * CHANGED)
+    ys, xs = rng.integers(0, HEIGHT, n), rng.integers(0, WIDTH, n)
+    window.chars[ys, xs] = rng.choice(tuple(TEXT), n)
+
+
+def bench(push, change):
+    backend, window = CountingBackend(), new_window()
+    rng = np.random.default_rng(0)
+    push(backend, window)  # First push writes everything for both methods
+
+    backend.screen.calls = 0
+    elapsed = 0
+    for _ in range(FRAMES):
+        change(window, rng)
+        start = perf_counter()
+        push(backend, window)
+        elapsed += perf_counter() - start
+
+    return elapsed / FRAMES * 1000, backend.screen.calls / FRAMES
+
+
+if __name__ == "__main__":
+    print(f"{HEIGHT}x{WIDTH} screen, {FRAMES} frames")
+    print(f"{'scenario':<16}{'method':<12}{'ms/frame':>10}{'addstr/frame':>14}")
+    for scenario, change in (("all cells", full_change), (f"{CHANGED:.0%} of cells", sparse_change)):
+        for method, push in (("per-cell", per_cell_push), ("present", CursesBackend.present)):
+            ms, calls = bench(push, change)
+            print(f"{scenario:<16}{method:<12}{ms:>10.2f}{calls:>14.0f}")
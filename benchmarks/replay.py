@@ -0,0 +1,110 @@
+"""
+Record an interactive session of an example and replay it headless as a reproducible benchmark.
+
+`record` runs the example in the terminal as usual, recording every key and mouse event to a file (see
+:class: RecordingBackend).  `replay` runs the same example headless, fed from the recording (see :class: ReplayBackend),
+in real time or, with `--speed 0`, as fast as possible.  Reported per replay:
+
+    seconds             wall time of the replay
+    frames              frames presented
+    frame_ms_mean/max   time spent in `Root.refresh` per frame
+    frame_ms_p50/p99    time between consecutive frames
+    lag_ms_mean/max     how late the loop got to due timers
+
+Usage:
+    python benchmarks/replay.py record example session.nrs
+    python benchmarks/replay.py replay example session.nrs [--speed S] [--output results.json]
+"""
+import argparse
+import json
+import os
+import runpy
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from nurses import ScreenManager
+from nurses.backends import CursesBackend, HeadlessBackend, RecordingBackend, ReplayBackend
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES_DIR = os.path.join(ROOT, "examples")
+
+HEIGHT, WIDTH = 40, 120
+
+
+def run_example(name):
+    sys.argv = [name]
+    os.chdir(EXAMPLES_DIR)
+    runpy.run_path(os.path.join(EXAMPLES_DIR, f"{name}.py"), run_name="__main__")
+
+
+def record(name, path):
+    ScreenManager(backend=RecordingBackend(CursesBackend(mouse=True), path))
+    run_example(name)
+
+
+def replay(name, path, speed):
+    times = [ ]
+
+    class TimedBackend(HeadlessBackend):
+        def present(self, window):
+            times.append(perf_counter())
+            super().present(window)
+
+    sm = ScreenManager(backend=ReplayBackend(TimedBackend(HEIGHT, WIDTH), path, speed=speed or None))
+    stats = sm.enable_stats()
+
+    start = perf_counter()
+    run_example(name)
+    elapsed = perf_counter() - start
+
+    intervals = np.diff(times) * 1000
+
+    return {
+        "example": name,
+        "recording": path,
+        "speed": speed,
+        "seconds": round(elapsed, 4),
+        "frames": len(times),
+        "frame_ms_mean": round(stats.mean_refresh_time * 1000, 3),
+        "frame_ms_max": round(stats.max_refresh_time * 1000, 3),
+        "frame_ms_p50": round(float(np.percentile(intervals, 50)), 3) if len(intervals) else None,
+        "frame_ms_p99": round(float(np.percentile(intervals, 99)), 3) if len(intervals) else None,
+        "lag_ms_mean": round(stats.mean_lag * 1000, 3),
+        "lag_ms_max": round(stats.max_lag * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("mode", choices=("record", "replay"))
+    parser.add_argument("example")
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1, help="replay speed; 0 replays as fast as possible")
+    parser.add_argument("--output", help="write results as json to this file")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.recording)
+    output = args.output and os.path.abspath(args.output)
+
+    if args.mode == "record":
+        record(args.example, path)
+        return
+
+    # Suppress anything the example prints so stdout only carries the result.
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        result = replay(args.example, path, args.speed)
+        sys.stdout = stdout
+
+    for key, value in result.items():
+        print(f"{key:<16}{value}")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(result, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compare the scheduler's sleeping-task queues: the default binary heap and a hierarchical timing wheel.
+
+`n` tasks sleep for random delays of up to `MAX_DELAY` seconds and go back to sleep each time they wake, so there are
+always `n` sleepers.  Two numbers are reported per queue, both in microseconds per wakeup:
+
+    queue       pushing and expiring tasks on the queue alone
+    scheduler   a full `Scheduler.run` of `n` sleeping coroutines on a virtual clock
+
+Usage:
+    python benchmarks/timer_benchmark.py [wakeups]
+"""
+import sys
+from collections import deque
+from random import Random
+from time import perf_counter
+
+import nurses.managers.scheduler as scheduler
+from nurses.managers.scheduler import Scheduler, Task
+from nurses.managers.timers import TimerHeap, TimingWheel
+
+SLEEPERS = 1_000, 10_000, 100_000
+WAKEUPS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+MAX_DELAY = 1.0
+RESOLUTION = .001
+STEP = .001  # Virtual seconds between expiries in the queue benchmark
+
+QUEUES = {
+    "heap": TimerHeap,
+    "wheel": lambda: TimingWheel(RESOLUTION),
+}
+
+
+class Done(Exception):
+    ...
+
+
+def bench_queue(new_queue, n):
+    rng = Random(0)
+    queue = new_queue()
+    now = 0.0
+    queue.expire(now, deque())
+
+    for _ in range(n):
+        task = Task(None, None)
+        task.deadline = now + rng.random() * MAX_DELAY
+        queue.push(task)
+
+    ready = deque()
+    wakeups = 0
+    start = perf_counter()
+    while wakeups < WAKEUPS:
+        now += STEP
+        queue.expire(now, ready)
+        wakeups += len(ready)
+        while ready:
+            task = ready.popleft()
+            task.deadline = now + rng.random() * MAX_DELAY
+            queue.push(task)
+
+    return (perf_counter() - start) / wakeups * 1e6
+
+
+def bench_scheduler(new_queue, n):
+    rng = Random(0)
+    clock = [0.0]
+    wakeups = [0]
+
+    def monotonic():
+        return clock[0]
+
+    def sleep(delay):
+        clock[0] += delay
+
+    scheduler.monotonic, scheduler.sleep = monotonic, sleep
+    sm = Scheduler(new_queue())
+
+    async def sleeper():
+        while True:
+            await sm.sleep(rng.random() * MAX_DELAY)
+            wakeups[0] += 1
+            if wakeups[0] == WAKEUPS:
+                raise Done
+
+    sm.run_soon(*(sleeper() for _ in range(n)))
+    start = perf_counter()
+    try:
+        sm.run()
+    except Done:
+        pass
+
+    return (perf_counter() - start) / WAKEUPS * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{WAKEUPS} wakeups, delays up to {MAX_DELAY}s, wheel resolution {RESOLUTION}s")
+    print(f"{'sleepers':>10}{'queue':>8}{'queue us':>11}{'scheduler us':>15}")
+    for n in SLEEPERS:
+        for name, new_queue in QUEUES.items():
+            print(f"{n:>10}{name:>8}{bench_queue(new_queue, n):>11.2f}{bench_scheduler(new_queue, n):>15.2f}")
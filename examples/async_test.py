@@ -35,5 +35,4 @@ with ScreenManager() as sm:
     for widget in sm.root.group["moving"]:
         sm.schedule(widget.roll, delay=.1, n=150)
     sm.schedule(resize, delay=1, n=15)
-    sm.schedule(sm.root.refresh, delay=.1, n=150)
     sm.run(scroll())
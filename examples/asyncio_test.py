@@ -0,0 +1,39 @@
+"""
+Stream metrics from a local socket into a chart.  `run_async` runs nurses on an asyncio event loop, so tasks can await
+asyncio streams directly.
+"""
+import asyncio
+from random import random
+
+from nurses import ScreenManager, colors
+
+
+async def serve_metrics(reader, writer):
+    try:
+        while True:
+            writer.write(f"{random() * 50}\n".encode())
+            await writer.drain()
+            await asyncio.sleep(.1)
+    except (ConnectionError, asyncio.CancelledError):  # Client disconnected or the app is shutting down.
+        writer.close()
+
+
+async def main():
+    server = await asyncio.start_server(serve_metrics, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+
+    with ScreenManager() as sm:
+        blue_to_purple = colors.gradient(20, (0, 255, 255), (103, 15, 215), "blue_to_purple")
+        chart = sm.root.new_widget(create_with="Chart", maxlen=200, gradient=blue_to_purple, size_hint=(.5, .5), y_label=5)
+
+        async def stream_metrics():
+            reader, writer = await asyncio.open_connection(host, port)
+            while line := await reader.readline():
+                chart.update(float(line))
+
+        await sm.run_async(stream_metrics())
+
+    server.close()
+
+
+asyncio.run(main())
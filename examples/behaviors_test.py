@@ -78,5 +78,4 @@ with ScreenManager() as sm:
 
     sm.schedule(lambda: mc.update_color(next(rainbow)), delay=.1)
     sm.schedule(lambda: chart.update(random() * 50), delay=.1)
-    sm.schedule(sm.root.refresh)
     sm.run()
@@ -17,6 +17,6 @@ with ScreenManager() as sm:
         big_clock.update_color(next(blue_to_yellow))
         small_clock.update_color(next(rainbow))
 
-    sm.schedule(sm.root.refresh)
+    sm.schedule(sm.request_redraw, delay=1 / sm.fps)
     sm.schedule(update_color, delay=.1)
     sm.run()
@@ -78,24 +78,25 @@ class CodeRain(ArrayWin):
         # Fade trail to black
         for i in range(CODE_RAIN_HEIGHT - 1):
             self.colors[1: -1] = self.colors[: -2]
-            self.buffer[i] = " "
+            self[i] = " "
             await sm.sleep(TIME_PER_ROW)
 
         CodeRain.drops_falling -= 1
 
     async def new_char(self):
         while True:
-            self.buffer[-1] = np.random.choice(MATRIX_KANJI)
+            self[-1] = np.random.choice(MATRIX_KANJI)
             await sm.next_task()
 
     async def fade(self):
         for color in self.gradient:
             self.colors[-1] = color
+            self.request_redraw()
             await sm.next_task()
 
         await sm.sleep(self.delay / 8)
         self._char_task.cancel()
-        self.buffer[-1] = self.character
+        self[-1] = self.character
 
 async def fade_when_done():
     while CodeRain.drops_falling:
@@ -126,5 +127,4 @@ with ScreenManager() as sm:
                 sm.root.add_widget(CodeRain(y, x, character=char, gradient=BLUE if c[y, x] else YELLOW, delay=start_times[y, x]))
 
     sm.run_soon(fade_when_done())
-    sm.schedule(sm.root.refresh)
-    sm.run()
+    sm.run(until_exit=True)
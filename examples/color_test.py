@@ -26,7 +26,7 @@ with ScreenManager() as sm:
     def update():
         widget.colors[:, :5] = next(rainbow)
         widget.colors[:, 5:] = next(purp_to_teal)
-        widget.root.refresh()
+        widget.request_redraw()
 
     sm.schedule(update, delay=.1)
     sm.run()
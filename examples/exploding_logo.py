@@ -80,21 +80,16 @@ class Particle(Widget):
             return
 
         super().update_geometry()
-        self.window.addstr(0, 0, self.character, colors.palette["rainbow"][int(self.color)])
-
-    def on_press(self, key):
-        if key == SPACE:
-            self.poke()
-            if self._step_task.is_canceled:
-                self._step_task = self._step_task()
-        elif key == RESET:
-            sm.run_soon(self.reset())
+        self.window.addstr(0, 0, self.character, colors.palette["rainbow"][int(self.color) % COLORS])
 
     def poke(self):
         dyx = self.pos - complex(cursor.top - 1, cursor.left - 1)
         if dyx != 0:
             self.vel += POKE_POWER / (dyx.real**2 + dyx.imag**2) * dyx
 
+        if self._step_task.is_canceled:
+            self._step_task = self._step_task()
+
     def step(self):
         if (mag := abs(self.vel)) < .0001:
             return self._step_task.cancel()
@@ -132,7 +127,8 @@ class Particle(Widget):
                 return
 
     def refresh(self):
-        self.window.chgat(0, 0, colors.palette["rainbow"][int(self.color)])
+        self.window.chgat(0, 0, colors.palette["rainbow"][int(self.color) % COLORS])
+        super().refresh()
 
 
 with ScreenManager() as sm:
@@ -143,13 +139,20 @@ with ScreenManager() as sm:
     c[-7:] = c[-13: -7, -41:] = c[-14, -17:] = c[-20: -14, -15:] = YELLOW
 
     # Create a Particle for each non-space character in the logo
+    particles = [ ]
     for y, row in enumerate(LOGO.splitlines()):
         for x, char in enumerate(row):
             if char != " ":
-                sm.root.add_widget(Particle(y, x, character=char, color=c[y, x]))
+                particles.append(Particle(y, x, character=char, color=c[y, x]))
+                sm.root.add_widget(particles[-1])
 
     cursor = sm.root.new_widget(HEIGHT // 2, WIDTH // 2, 3, 3, transparent=True, create_with=Cursor)
     cursor.window.addstr(0, 0, " | \n-+-\n | ")
 
-    sm.schedule(sm.root.refresh)
-    sm.run()
+    # Arrow keys go straight to the focused cursor; poking and resetting are global hotkeys, so key presses
+    # aren't broadcast to every particle.
+    sm.root.focus.set_focus(cursor)
+    sm.root.focus.add_hotkey(SPACE, lambda: [particle.poke() for particle in particles])
+    sm.root.focus.add_hotkey(RESET, lambda: sm.run_soon(*(particle.reset() for particle in particles)))
+
+    sm.run(until_exit=True)
@@ -15,7 +15,6 @@ with ScreenManager() as sm:
         widget[ 1, -1] = tr
         widget[-1, -2] = br
         widget[-2,  0] = bl
-        sm.root.refresh()
 
     sm.schedule(marching_border, delay=.1, n=120)
     sm.run()
@@ -29,6 +29,5 @@ with ScreenManager() as sm:
             right.scroll(-1)
             right[0, :14] = f"Scroll down {i:02}"
 
-    sm.schedule(sm.root.refresh, delay=.1, n=100)
     sm.schedule(title.roll, delay=.1, n=100)
     sm.run(scroll_up(), scroll_down())
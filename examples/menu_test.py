@@ -18,5 +18,4 @@ with ScreenManager() as sm:
         create_with="Menubar",
     )
 
-    sm.schedule(sm.root.refresh)
-    sm.run()
+    sm.run(until_exit=True)
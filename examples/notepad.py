@@ -21,8 +21,7 @@ with ScreenManager() as sm:
         while fe.file is None:
             await sm.next_task()
 
-        with open(fe.file) as f:
-            tp.text = f.read()
+        tp.text = await sm.run_in_thread(fe.file.read_text)
 
     # Menus for menu bar:
     file = (
@@ -46,5 +45,4 @@ with ScreenManager() as sm:
         create_with="Menubar"
     )
 
-    sm.schedule(sm.root.refresh)
-    sm.run()
+    sm.run(until_exit=True)
@@ -1,3 +1,4 @@
+import numpy as np
 from nurses import ScreenManager, colors
 from nurses.widgets import ArrayPad
 from nurses.widgets.behaviors import Scrollable
@@ -8,12 +9,12 @@ class ScrollingPad(ArrayPad, Scrollable):
 with ScreenManager() as sm:
     scroll_pad = sm.root.new_widget(
         create_with=ScrollingPad, rows=200, cols=200, size_hint=(1.0, 1.0),
-        right_scrollbar=True, bottom_scrollbar=True, bar_color=colors.BLUE_ON_WHITE
+        right_scrollbar=True, bottom_scrollbar=True, bar_color=colors.BLUE_ON_WHITE,
+        char_dtype=np.uint32, color_dtype=np.uint16,  # Compact cells: code points and 16-bit color pair attributes
     )
 
     for i, color in enumerate(colors.gradient(200, (0, 0, 255), (255, 255, 255), "blue_to_white")):
         scroll_pad[i, :] = f'{f"{i:03}":>10}' * 20
         scroll_pad.pad_colors[i] = color
 
-    sm.schedule(sm.root.refresh)
-    sm.run()
+    sm.run(until_exit=True)
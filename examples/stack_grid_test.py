@@ -18,5 +18,5 @@ with ScreenManager() as sm:
         widget[0, :10] = "Testing..."
         sm.schedule(widget.roll, delay=i / 10, n=100 // i)
 
-    sm.schedule(sm.root.refresh, delay=.1, n=100)
+    sm.schedule(sm.request_redraw, delay=.1, n=100)
     sm.run()
@@ -21,7 +21,7 @@ with ScreenManager() as sm:
     tb = sm.root.new_widget(0, 0, 20, create_with=BouncingTextbox)
     tb.schedule_bounce()
 
-    refresh_task = sm.schedule(sm.root.refresh, delay=.1)
+    refresh_task = sm.schedule(sm.request_redraw, delay=.1)
 
     async def print_result():
         print(await tb.gather())
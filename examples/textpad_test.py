@@ -48,7 +48,6 @@ Beware the Jubjub bird, and shun
       The frumious Bandersnatch!"""
 
     sm.schedule(crazy_colors, delay=.1)
-    sm.schedule(sm.root.refresh)
     sm.run()
 
     print(tp.text)
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .curses_backend import CursesBackend
+from .headless import HeadlessBackend
+from .recording import RecordingBackend, ReplayBackend, load_recording
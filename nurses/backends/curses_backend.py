@@ -0,0 +1,156 @@
+import curses
+import sys
+
+import numpy as np
+
+from ..mouse import MouseEvent
+
+MOUSE_TRACKING_ON = "\033[?1002h"  # Report motion while a button is held, so drags can be decoded.
+MOUSE_TRACKING_OFF = "\033[?1002l"
+BRACKETED_PASTE_ON = "\033[?2004h"  # Wrap pasted text in ESC [200~ ... ESC [201~, so it can be told apart from typing.
+BRACKETED_PASTE_OFF = "\033[?2004l"
+
+
+class CursesBackend:
+    """
+    :class: CursesBackend starts and closes curses, reads keys from the terminal, and writes composited frames to it.
+
+    Parameters
+    ----------
+    mouse: optional
+        Report mouse events (see :class: MouseEvent).  While the terminal reports them, it won't select text with the
+        mouse. (the default is False)
+
+    bracketed_paste: optional
+        Have the terminal mark pasted text, so the screen manager dispatches a paste as a single :class: Paste.
+        (the default is True)
+    """
+    def __init__(self, mouse=False, bracketed_paste=True):
+        self.screen = screen = curses.initscr()
+        screen.keypad(True)
+        screen.nodelay(True)
+        curses.cbreak()
+        curses.noecho()
+        curses.curs_set(0)
+        curses.start_color()
+
+        self.mouse = mouse
+        if mouse:
+            curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
+            curses.mouseinterval(0)  # Report presses and releases as they happen; clicks are made by the ScreenManager.
+            sys.stdout.write(MOUSE_TRACKING_ON)
+            sys.stdout.flush()
+
+        self.bracketed_paste = bracketed_paste
+        if bracketed_paste:
+            sys.stdout.write(BRACKETED_PASTE_ON)
+            sys.stdout.flush()
+
+        self._presented = None  # Copy of the last presented frame; only cells that differ are re-written.
+
+    def getmaxyx(self):
+        return self.screen.getmaxyx()
+
+    def getch(self):
+        return self.screen.getch()
+
+    def getmouse(self):
+        """Decode the mouse event that made `getch` return `KEY_MOUSE`; None if it can't be read.
+        """
+        try:
+            _, x, y, _, bstate = curses.getmouse()
+        except curses.error:
+            return None
+
+        return MouseEvent.from_curses(y, x, bstate)
+
+    def fileno(self):
+        """
+        The file descriptor keys are read from; the screen manager waits on it instead of polling `getch`.  None on
+        windows, where selectors only accept sockets, so the screen manager polls.
+        """
+        if sys.platform == "win32":
+            return None
+
+        return sys.stdin.fileno()
+
+    def pause(self):
+        """A blocking getch.
+        """
+        screen = self.screen
+        screen.nodelay(False)
+        key = screen.getch()
+        screen.nodelay(True)
+        return key
+
+    def flushinp(self):
+        curses.flushinp()
+
+    def init_color(self, color, r, g, b):
+        curses.init_color(color, r, g, b)
+
+    def init_pair(self, pair, fore, back):
+        curses.init_pair(pair, fore, back)
+
+    def color_pair(self, pair):
+        return curses.color_pair(pair)
+
+    def present(self, window):
+        """
+        Write the cells of `window` that have changed since the last present to the screen.
+
+        Notes
+        -----
+        Changed cells are merged into runs of horizontally adjacent cells of the same color and each run is written with
+        a single `addstr`.
+        """
+        chars, colors = window.chars, window.colors
+        presented = self._presented
+
+        if presented is None or presented[0].shape != chars.shape:
+            ys, xs = np.indices(chars.shape).reshape(2, -1)
+            self._presented = chars.copy(), colors.copy()
+        else:
+            presented_chars, presented_colors = presented
+            ys, xs = np.nonzero((chars != presented_chars) | (colors != presented_colors))
+            presented_chars[ys, xs] = chars[ys, xs]
+            presented_colors[ys, xs] = colors[ys, xs]
+
+        if len(ys):
+            cells = chars[ys, xs]
+            cells[cells == "\n"] = " "  # A newline would move the cursor
+            cell_colors = colors[ys, xs]
+
+            # A run ends wherever the next changed cell is on another row, isn't adjacent, or has a different color.
+            ends = np.flatnonzero((ys[1:] != ys[:-1]) | (xs[1:] != xs[:-1] + 1) | (cell_colors[1:] != cell_colors[:-1])) + 1
+            starts = np.concatenate(([0], ends))
+            ends = np.concatenate((ends, [len(ys)]))
+
+            cells = cells.tolist()
+            screen = self.screen
+            for start, end, y, x, color in zip(
+                starts.tolist(), ends.tolist(), ys[starts].tolist(), xs[starts].tolist(), cell_colors[starts].tolist()
+            ):
+                screen.addstr(y, x, "".join(cells[start: end]), color)
+
+        self.screen.refresh()
+
+    def invalidate(self):
+        """Re-write the whole frame on the next present (e.g., after the terminal was resized or cleared).
+        """
+        self._presented = None
+
+    def close(self):
+        if self.mouse:
+            sys.stdout.write(MOUSE_TRACKING_OFF)
+            sys.stdout.flush()
+
+        if self.bracketed_paste:
+            sys.stdout.write(BRACKETED_PASTE_OFF)
+            sys.stdout.flush()
+
+        self.screen.keypad(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.flushinp()
+        curses.endwin()
@@ -0,0 +1,91 @@
+from collections import deque
+import curses
+
+from ..window import Window
+
+
+class HeadlessBackend:
+    """
+    :class: HeadlessBackend runs nurses without a terminal.  Frames are presented to `screen`, a :class: Window, so they
+    can be inspected as arrays (`screen.chars`, `screen.colors`), and keys are read from a scripted queue.
+
+    Parameters
+    ----------
+    height, width: optional
+        Dimensions of the virtual screen. (the defaults are 24, 80)
+
+    keys: optional
+        An iterable of keys (ints or single characters) that `getch` will return in order. More keys can be added with `feed`,
+        and mouse events with `feed_mouse`.
+
+    Notes
+    -----
+    Color pairs are numbered as curses would number them, but nothing is initialized.
+    """
+    def __init__(self, height=24, width=80, keys=()):
+        self.screen = Window(height, width)
+        self.keys = deque()
+        self.mouse_events = deque()
+        self.frames = 0  # Number of frames presented
+        self.pairs = { }  # pair number -> (fore, back), for inspection
+        self.feed(*keys)
+
+    def getmaxyx(self):
+        return self.screen.getmaxyx()
+
+    def feed(self, *keys):
+        """Queue `keys` to be returned by `getch`.
+        """
+        self.keys.extend(ord(key) if isinstance(key, str) else key for key in keys)
+
+    def feed_mouse(self, *events):
+        """Queue :class: MouseEvents; `getch` returns `KEY_MOUSE` for each and `getmouse` returns the event.
+        """
+        self.mouse_events.extend(events)
+        self.keys.extend(curses.KEY_MOUSE for _ in events)
+
+    def getmouse(self):
+        return self.mouse_events.popleft() if self.mouse_events else None
+
+    def resize(self, height, width):
+        """Resize the virtual screen; a `KEY_RESIZE` is queued as a terminal would.
+        """
+        self.screen.resize(height, width)
+        self.keys.append(curses.KEY_RESIZE)
+
+    def getch(self):
+        return self.keys.popleft() if self.keys else curses.ERR
+
+    def fileno(self):
+        """There's no file descriptor to wait on; `getch` is polled once per tick instead.
+        """
+        return None
+
+    def pause(self):
+        return self.getch()
+
+    def flushinp(self):
+        pass
+
+    def init_color(self, color, r, g, b):
+        pass
+
+    def init_pair(self, pair, fore, back):
+        self.pairs[pair] = fore, back
+
+    def color_pair(self, pair):
+        return pair << 8  # Same as ncurses' COLOR_PAIR
+
+    def present(self, window):
+        screen = self.screen
+        h, w = map(min, window.getmaxyx(), screen.getmaxyx())
+        screen.chars[:h, :w] = window.chars[:h, :w]
+        screen.colors[:h, :w] = window.colors[:h, :w]
+        screen.chars[screen.chars == "\n"] = " "  # As a terminal would show them
+        self.frames += 1
+
+    def invalidate(self):
+        pass
+
+    def close(self):
+        pass
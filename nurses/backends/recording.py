@@ -0,0 +1,194 @@
+import curses
+import struct
+from time import monotonic
+
+from ..keys import ESCAPE
+from ..mouse import MouseEvent, PRESS, RELEASE, CLICK, DRAG, MOVE, WHEEL_UP, WHEEL_DOWN
+
+MAGIC = b"NURSESI1"
+# Microseconds since the previous event, flags, key (or mouse button), y, x.  Flags: bit 0 is set on the first event
+# read in a tick; bits 1-3 are 0 for keys or 1 + the index of the mouse event's type in MOUSE_TYPES.
+RECORD = struct.Struct("<IBihh")
+MAX_DELTA = 2**32 - 1
+NEW_TICK = 1
+MOUSE_TYPES = PRESS, RELEASE, CLICK, DRAG, MOVE, WHEEL_UP, WHEEL_DOWN
+
+
+class RecordingBackend:
+    """
+    Wraps a backend and records the keys and mouse events read from it, with their times, to a file that
+    :class: ReplayBackend can replay.
+
+    Parameters
+    ----------
+    backend:
+        The backend to wrap, e.g., a :class: CursesBackend.
+
+    path:
+        The file to record to.  It's written as events are read and closed when the backend is closed.
+
+    Notes
+    -----
+    Each event takes 13 bytes.  Which events were read in the same tick is recorded too, so that a replay dispatches
+    them in the same groups.
+
+    Examples
+    --------
+    >>> sm = ScreenManager(backend=RecordingBackend(CursesBackend(), "session.nrs"))
+    """
+    def __init__(self, backend, path):
+        self.backend = backend
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._last = monotonic()
+        self._new_tick = True
+
+    def __getattr__(self, attr):
+        return getattr(self.backend, attr)
+
+    def _record(self, key, y=0, x=0, kind=0):
+        now = monotonic()
+        delta = min(MAX_DELTA, round((now - self._last) * 1e6))
+        self._last = now
+
+        self._file.write(RECORD.pack(delta, NEW_TICK * self._new_tick | kind << 1, key, y, x))
+        self._new_tick = False
+
+    def getch(self):
+        key = self.backend.getch()
+
+        if key == curses.ERR:
+            self._new_tick = True
+        elif key != curses.KEY_MOUSE:  # Mouse events are recorded decoded, by `getmouse`.
+            self._record(key)
+
+        return key
+
+    def getmouse(self):
+        if (event := self.backend.getmouse()) is not None:
+            self._record(event.button, event.y, event.x, 1 + MOUSE_TYPES.index(event.type))
+
+        return event
+
+    def close(self):
+        self._file.close()
+        self.backend.close()
+
+
+class ReplayBackend:
+    """
+    Wraps a backend, but reads keys and mouse events from a file recorded with :class: RecordingBackend instead of from
+    the wrapped backend.  Frames are still presented by the wrapped backend.
+
+    Parameters
+    ----------
+    backend:
+        The backend to wrap, e.g., a :class: HeadlessBackend.
+
+    path:
+        The recording to replay.
+
+    speed: optional
+        Replay speed relative to the recording (2 is twice as fast); None replays events as fast as possible, each tick's
+        events on their own tick. (the default is 1)
+
+    exit_at_end: optional
+        Return the EXIT key once the recording is done, if it didn't end with one. (the default is True)
+
+    Notes
+    -----
+    Events are dispatched in the same order and in the same groups (the events read during one tick of the getch loop)
+    as they were recorded, so a replay against the same widget tree makes the same calls.  Timers still run on the real
+    clock, so tasks driven by time may interleave differently with input, especially when `speed` is None.
+
+    There's no file descriptor to wait on, so `getch` is polled once per tick.
+
+    Examples
+    --------
+    >>> sm = ScreenManager(backend=ReplayBackend(HeadlessBackend(), "session.nrs", speed=None))
+    >>> stats = sm.enable_stats()
+    >>> sm.run()
+    """
+    def __init__(self, backend, path, speed=1, exit_at_end=True):
+        self.backend = backend
+        self.speed = speed
+        self.exit_at_end = exit_at_end
+        self.events = load_recording(path)  # (seconds since the recording started, starts a tick, key or MouseEvent)
+
+        self._next = 0
+        self._start = None
+        self._tick_ended = False
+        self._mouse_event = None
+
+    def __getattr__(self, attr):
+        return getattr(self.backend, attr)
+
+    @property
+    def is_done(self):
+        return self._next == len(self.events)
+
+    def getch(self):
+        if self._start is None:
+            self._start = monotonic()
+
+        if self.is_done:
+            if self.exit_at_end and not (self.events and self.events[-1][2] == ESCAPE):
+                self.exit_at_end = False
+                return ESCAPE
+            return curses.ERR
+
+        time, new_tick, event = self.events[self._next]
+
+        if new_tick and not self._tick_ended:  # End the current tick; this event starts the next one.
+            self._tick_ended = True
+            return curses.ERR
+
+        if self.speed is not None and monotonic() - self._start < time / self.speed:
+            return curses.ERR
+
+        self._next += 1
+        self._tick_ended = False
+
+        if isinstance(event, MouseEvent):
+            self._mouse_event = event
+            return curses.KEY_MOUSE
+
+        return event
+
+    def getmouse(self):
+        event, self._mouse_event = self._mouse_event, None
+        return MouseEvent(event.type, event.y, event.x, event.button)  # A fresh copy; dispatching may change it.
+
+    def fileno(self):
+        return None
+
+    def flushinp(self):
+        pass
+
+
+def load_recording(path):
+    """
+    Return the events in a recording made with :class: RecordingBackend as a list of `(time, new_tick, event)`: seconds
+    since the recording started, whether the event was the first read in its tick, and a key or :class: MouseEvent.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} isn't a nurses input recording")
+
+    records = data[len(MAGIC):]
+    records = records[:len(records) - len(records) % RECORD.size]  # Drop a partly written record (e.g., after a crash).
+
+    events = [ ]
+    time = 0
+    for delta, flags, key, y, x in RECORD.iter_unpack(records):
+        time += delta / 1e6
+        if kind := flags >> 1:
+            event = MouseEvent(MOUSE_TYPES[kind - 1], y, x, key)
+        else:
+            event = key
+
+        events.append((time, bool(flags & NEW_TICK), event))
+
+    return events
@@ -7,6 +7,7 @@ DOWN = 258
 UP = 259
 LEFT = 260
 RIGHT = 261
+F12 = 276
 SLEFT = 391
 SRIGHT = 400
 CRIGHT = 443
@@ -25,3 +26,36 @@ CDOWN = 481
 CENTER = 529
 SUP = 547
 SDOWN = 548
+
+NAVIGATION_KEYS = frozenset({ UP, DOWN, LEFT, RIGHT, UP_2, DOWN_2, LEFT_2, RIGHT_2, PGUP, PGDN })
+
+
+class KeyRepeat(int):
+    """
+    A key pressed `count` times in a row, dispatched once (see ScreenManager's `coalesce_keys`).  It compares equal to the
+    key, so widgets that don't know about repeats handle it as a single press.
+
+    Widgets that can apply a batched step call `consume()` to get the count; if the widget that handles a repeat doesn't
+    consume it, the key is dispatched again for each remaining press.
+    """
+    def __new__(cls, key, count):
+        repeat = super().__new__(cls, key)
+        repeat.count = count
+        repeat.is_consumed = False
+        return repeat
+
+    def consume(self):
+        self.is_consumed = True
+        return self.count
+
+
+class Paste(str):
+    """
+    Text pasted into the terminal (or typed in a burst, see ScreenManager's `paste_burst`), dispatched as a single event
+    instead of a key press per character.
+
+    Widgets that edit text, like :class: TextPad and :class: Textbox, insert it in one edit.  If no widget handles a
+    paste, each character is dispatched as a key press.
+    """
+    def __repr__(self):
+        return f"{type(self).__name__}({super().__repr__()})"
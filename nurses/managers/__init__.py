@@ -1,4 +1,7 @@
 from .screen_manager import ScreenManager
 from .color_manager import ColorManager
+from .scheduler import INPUT, RENDER, BACKGROUND
+from .stats import SchedulerStats
+from .timers import TimerHeap, TimingWheel
 
 colors = ColorManager()
@@ -1,5 +1,4 @@
 from collections import defaultdict
-import curses
 from itertools import count, product, repeat
 from math import pi, sin
 import re
@@ -39,7 +38,11 @@ class ColorManager(metaclass=Singleton):
     -----
     The names BLACK, BLUE, GREEN, CYAN, RED, MAGENTA, YELLOW, WHITE are already defined and can't be redefined.
     These are your terminal default colors, don't necessarily correspond to black, blue, green, etc.
+
+    Colors and pairs are initialized by `backend`, which the ScreenManager sets when it starts.
     """
+    backend = None
+
     def __init__(self):
         self._names_to_rgb = dict(zip(DEFAULT_COLORS, DEFAULT_RGBS))
         self._rgb_to_curses = defaultdict(count(INIT_COLOR_START).__next__, zip(DEFAULT_RGBS, count()))
@@ -105,7 +108,7 @@ class ColorManager(metaclass=Singleton):
         rgbs = self._rgb_to_curses
 
         if rgb not in rgbs:
-            curses.init_color(rgbs[rgb], *scale(rgb))
+            self.backend.init_color(rgbs[rgb], *scale(rgb))
 
         return rgbs[rgb]
 
@@ -119,9 +122,9 @@ class ColorManager(metaclass=Singleton):
         color = self.color
 
         if pair not in pairs:
-            curses.init_pair(pairs[pair], color(fore), color(back))
+            self.backend.init_pair(pairs[pair], color(fore), color(back))
 
-        color_pair = curses.color_pair(pairs[pair])
+        color_pair = self.backend.color_pair(pairs[pair])
 
         if palette is not None:
             self.palette[palette].append(color_pair)
@@ -3,8 +3,10 @@ class Singleton(type):
     """
     _instances = { }
 
-    def __call__(cls):
+    def __call__(cls, *args, **kwargs):
+        """Arguments are only used when the instance is first created.
+        """
         instances = cls._instances
         if cls not in instances:
-            instances[cls] = super().__call__()
+            instances[cls] = super().__call__(*args, **kwargs)
         return instances[cls]
@@ -1,21 +1,59 @@
+import asyncio
 from collections import deque
-from heapq import heappop, heappush
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import selectors
+import socket
 from textwrap import dedent
-from time import monotonic, sleep
+from time import monotonic, perf_counter, sleep
 from types import coroutine
 
+from .stats import SchedulerStats
+from .timers import TimerHeap
+
+# Priority lanes: ready tasks in lower-numbered lanes run first.
+INPUT, RENDER, BACKGROUND = range(3)
+
+SCHEDULE_MODES = "fixed_delay", "fixed_rate"
+MISSED_TICK_POLICIES = "skip", "catch_up", "coalesce"
+
 
 class Task:
-    __slots__ = "scheduler", "coro", "is_canceled", "deadline", "is_rescheduled", "result"
+    __slots__ = (
+        "scheduler", "coro", "priority", "is_canceled", "deadline", "is_rescheduled", "is_parked", "is_sleeping",
+        "result", "waker",
+    )
 
-    def __init__(self, scheduler, coro):
+    def __init__(self, scheduler, coro, priority=BACKGROUND):
         self.scheduler = scheduler
         self.coro = coro
+        self.priority = priority  # The task's lane: INPUT, RENDER or BACKGROUND
         self.is_canceled = False
         self.is_rescheduled = False
+        self.is_parked = False
+        self.is_sleeping = False
 
-    def cancel(self):
-        self.is_canceled = True
+    def cancel(self, close=False):
+        """
+        Unschedule this task.  Unless `close` is true, the task can be rescheduled by calling it.
+
+        Parameters
+        ----------
+        close: optional
+            Also close the task's coroutine (so its `finally` blocks run); it can't be resumed afterwards. A task can't
+            close itself while it's running. (the default is False)
+        """
+        if not self.is_canceled:
+            self.is_canceled = True
+
+            scheduler = self.scheduler
+            if scheduler._loop is not None:
+                if driver := scheduler._drivers.get(self):
+                    driver.cancel()
+            elif self.is_sleeping:
+                scheduler.sleeping.discard(self)
+
+        if close:
+            self.coro.close()
 
     def __call__(self):
         """
@@ -38,68 +76,632 @@ class Task:
             raise RuntimeError("task already rescheduled")
 
         self.is_rescheduled = True
-        return self.scheduler.new_task(self.coro)
+        return self.scheduler.new_task(self.coro, self.priority)
 
     def __lt__(self, other):
         return self.deadline < other.deadline
 
 
+class ReadyQueue:
+    """
+    The :class: Scheduler's ready tasks: one FIFO lane per priority.  Appended tasks go to the lane of their `priority`.
+    """
+    __slots__ = "lanes",
+
+    def __init__(self, n_lanes=BACKGROUND + 1):
+        self.lanes = [deque() for _ in range(n_lanes)]
+
+    def __len__(self):
+        return sum(map(len, self.lanes))
+
+    def __bool__(self):
+        return any(self.lanes)
+
+    def __iter__(self):
+        for lane in self.lanes:
+            yield from lane
+
+    def append(self, task):
+        self.lanes[task.priority].append(task)
+
+    def extend(self, tasks):
+        for task in tasks:
+            self.lanes[task.priority].append(task)
+
+    def clear(self):
+        for lane in self.lanes:
+            lane.clear()
+
+
+class Callback:
+    """
+    A callable scheduled with :class: Scheduler's `schedule`.  It's handled like a :class: Task: `callback.cancel()`
+    unschedules it, calling a canceled callback reschedules it (with the calls it has left) and returns the new
+    callback, and `result` is set to the return value of the last call once it has been called `n` times.
+
+    `missed_ticks` counts the ticks of a "fixed_rate" callback that came a period or more late.
+    """
+    __slots__ = (
+        "scheduler", "callable", "args", "kwargs", "delay", "n", "mode", "missed", "missed_ticks", "is_canceled",
+        "is_rescheduled", "result",
+    )
+
+    def __init__(self, scheduler, callable, args, kwargs, delay, n, mode, missed):
+        self.scheduler = scheduler
+        self.callable = callable
+        self.args = args
+        self.kwargs = kwargs
+        self.delay = delay
+        self.n = n  # Calls left; 0 if unlimited
+        self.mode = mode
+        self.missed = missed
+        self.missed_ticks = 0
+        self.is_canceled = False
+        self.is_rescheduled = False
+
+    def cancel(self, close=False):
+        """
+        Unschedule this callback.  Unless `close` is true, the callback can be rescheduled by calling it.
+
+        Parameters
+        ----------
+        close: optional
+            The callback can't be rescheduled afterwards, as a :class: Task whose coroutine is closed can't.
+            (the default is False)
+        """
+        self.is_canceled = True
+
+        if close:
+            self.is_rescheduled = True
+
+    def __call__(self):
+        """
+        Reschedule this callback. Returns the new callback.
+
+        Raises
+        ------
+        RuntimeError
+            If the callback isn't canceled or if callback has already been rescheduled (or was closed).
+        """
+        if not self.is_canceled:
+            raise RuntimeError("callback already scheduled")
+
+        if self.is_rescheduled:
+            raise RuntimeError("callback already rescheduled")
+
+        self.is_rescheduled = True
+        return self.scheduler.schedule(
+            self.callable, *self.args, delay=self.delay, n=self.n, mode=self.mode, missed=self.missed, **self.kwargs
+        )
+
+
 class Scheduler:
-    __slots__ = "ready", "sleeping", "current"
+    """
+    A simple coroutine scheduler.
+
+    Parameters
+    ----------
+    timers: optional
+        The queue of sleeping tasks. (the default is a new :class: TimerHeap; a :class: TimingWheel makes sleeping O(1)
+        at the cost of rounding deadlines up to its resolution, which pays off with many thousands of sleeping tasks)
+
+    Notes
+    -----
+    When no task is ready the loop blocks until the earliest sleeping task's deadline or until a file descriptor a task
+    is waiting on (see `wait_readable`) becomes readable, whichever is first.  If `io_timeout` isn't None, tasks waiting
+    on a file descriptor are also woken once it has been waited on for `io_timeout` seconds.
+
+    `run_async` runs the same tasks on an asyncio event loop instead: each task is stepped by an asyncio task, `sleep`
+    and `park` suspend on asyncio futures, `wait_readable` uses `loop.add_reader`, and tasks may await any asyncio
+    awaitable (sockets, subprocesses, ...).
+
+    Blocking work can be offloaded with `run_in_thread` and `run_in_process`; the loop keeps running while it's done.
+
+    Ready tasks wait in priority lanes (INPUT, RENDER and BACKGROUND, see `new_task`).  Each round of the loop runs the
+    lanes in that order; a lane runs the tasks that were ready when its turn came, but stops early once it has run for
+    its budget (`budgets[lane]` seconds, None for no limit), so that busy background tasks can't hold up input and
+    rendering for long.  Tasks that stay ready run again next round, after timers and file descriptors are checked.
+    `run_async` ignores priorities.
+
+    `enable_stats` turns on instrumentation (per-task run time, loop lag and queue depths, see :class: SchedulerStats).
+    While `stats` is None the loop only pays for checking it.
+    """
+    __slots__ = (
+        "ready", "sleeping", "current", "waiting", "io_timeout", "_selector",
+        "_loop", "_drivers", "_active", "_done", "_error", "_io_timers",
+        "_thread_pool", "_process_pool", "_pending", "_completed", "_wakeup", "_groups", "_unstarted", "_is_running", "stats",
+        "budgets", "_waiting_since",
+    )
 
-    def __init__(self):
-        self.ready = deque()
-        self.sleeping = [ ]
+    def __init__(self, timers=None):
+        self.ready = ReadyQueue()
+        self.budgets = [None, None, .01]  # Seconds each lane may run per round; indexed by lane
+        self.sleeping = TimerHeap() if timers is None else timers
         self.current = None
+        self.waiting = { }  # file descriptor -> tasks (or, with `run_async`, futures) waiting for it to be readable
+        self.io_timeout = None
+        self._selector = None
+        self._waiting_since = { }  # file descriptor -> when its first waiter started waiting (for `io_timeout`)
+
+        # Only used by `run_async`:
+        self._loop = None
+        self._drivers = { }  # task -> the asyncio task stepping it
+        self._active = 0  # Number of tasks with a driver that aren't parked
+        self._done = None
+        self._error = None
+        self._io_timers = { }  # file descriptor -> `io_timeout` timer handle
+
+        # Used by `run_in_thread` and `run_in_process`:
+        self._thread_pool = None
+        self._process_pool = None
+        self._pending = set()  # Tasks waiting on an executor
+        self._completed = deque()  # Tasks whose executor jobs are done; appended to from worker threads
+        self._wakeup = None  # Socket pair; completed jobs write to it to wake a blocked loop
+
+        self._groups = { }  # delay or (delay, missed) -> callbacks of a group that hasn't ticked yet (see `schedule`)
+        self._unstarted = [ ]  # (key, callbacks) of groups scheduled before the loop started; their tasks start with it
+        self._is_running = False
+
+        self.stats = None  # A SchedulerStats while instrumentation is enabled
+
+    def enable_stats(self):
+        """Start collecting a :class: SchedulerStats (kept if already collecting) and return it.
+        """
+        if self.stats is None:
+            self.stats = SchedulerStats()
+
+        return self.stats
+
+    def disable_stats(self):
+        """Stop collecting stats.  Returns the stats collected so far, or None.
+        """
+        stats, self.stats = self.stats, None
+        return stats
 
     async def sleep(self, delay):
-        self.current.deadline = monotonic() + delay
-        heappush(self.sleeping, self.current)
+        if self._loop is not None:
+            self.current = None
+            future = self._loop.create_future()
+            self._loop.call_later(delay, _resolve, future)
+            return await self._suspend(future)
+
+        task = self.current
+        if not task.is_canceled:  # A task that canceled itself won't be resumed; queuing it would count it as live.
+            task.deadline = monotonic() + delay
+            self.sleeping.push(task)
+        self.current = None
+        await self.next_task()
+
+    async def park(self):
+        """Suspend the current task until it is passed to `wake`.
+        """
+        task = self.current
+        task.is_parked = True
+        self.current = None
+
+        if self._loop is not None:
+            self._active -= 1
+            task.waker = self._loop.create_future()
+            return await self._suspend(task.waker)
+
+        await self.next_task()
+
+    async def wait_readable(self, fd):
+        """
+        Suspend the current task until `fd` (a file descriptor or an object with a `fileno` method) is readable.
+
+        Notes
+        -----
+        Tasks may be woken before `fd` is readable (e.g., after `io_timeout`), so callers should check again.
+        """
+        if self._loop is not None:
+            self.current = None
+            future = self._loop.create_future()
+            if fd not in self.waiting:
+                self.waiting[fd] = [ ]
+                self._loop.add_reader(fd, self._wake_readers, fd)
+                if self.io_timeout is not None:
+                    self._io_timers[fd] = self._loop.call_later(self.io_timeout, self._wake_readers, fd)
+
+            self.waiting[fd].append(future)
+            return await self._suspend(future)
+
+        if fd not in self.waiting:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+
+            self._selector.register(fd, selectors.EVENT_READ)
+            self.waiting[fd] = [ ]
+            self._waiting_since[fd] = monotonic()
+
+        self.waiting[fd].append(self.current)
+        self.current = None
+        await self.next_task()
+
+    def _wait_for_io(self, timeout):
+        """Block until a waited on file descriptor is readable, an executor job completes, or `timeout` seconds have
+        passed, then wake the tasks waiting on readable file descriptors and on those waited on for `io_timeout` seconds.
+        """
+        for key, _ in self._selector.select(timeout):
+            if self._wakeup is not None and key.fileobj is self._wakeup[0]:
+                self._drain_wakeup()
+            else:
+                self._unregister(key.fileobj)
+
+        self._expire_io()
+
+    def _expire_io(self):
+        """Wake the tasks waiting on file descriptors that have been waited on for `io_timeout` seconds.
+        """
+        if self.io_timeout is not None and self._waiting_since:
+            expired = monotonic() - self.io_timeout
+            for fd in [fd for fd, since in self._waiting_since.items() if since <= expired]:
+                self._unregister(fd)
+
+    def _io_deadline(self):
+        """When the longest waiting file descriptor's `io_timeout` runs out, or None.
+        """
+        if self.io_timeout is None or not self._waiting_since:
+            return None
+
+        return min(self._waiting_since.values()) + self.io_timeout
+
+    def _unregister(self, fd):
+        """Stop selecting `fd` and make the tasks waiting on it ready.
+        """
+        self._selector.unregister(fd)
+        del self._waiting_since[fd]
+        self.ready.extend(self.waiting.pop(fd))
+
+    def _poll_io(self):
+        """Wake tasks whose file descriptors are readable (and collect executor jobs) without blocking.
+        """
+        for key, _ in self._selector.select(0):
+            if self._wakeup is not None and key.fileobj is self._wakeup[0]:
+                self._drain_wakeup()
+            else:
+                self._unregister(key.fileobj)
+
+        self._expire_io()
+
+    async def run_in_thread(self, fn, *args, **kwargs):
+        """
+        Call `fn(*args, **kwargs)` in a worker thread and return its result (or raise its exception) without blocking
+        the loop.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(thread_name_prefix="nurses")
+
+        return await self._run_in_executor(self._thread_pool, fn, *args, **kwargs)
+
+    async def run_in_process(self, fn, *args, **kwargs):
+        """
+        Call `fn(*args, **kwargs)` in a worker process and return its result (or raise its exception) without blocking
+        the loop.  `fn`, its arguments and its result must be picklable.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor()
+
+        return await self._run_in_executor(self._process_pool, fn, *args, **kwargs)
+
+    async def _run_in_executor(self, executor, fn, *args, **kwargs):
+        future = executor.submit(fn, *args, **kwargs)
+
+        if self._loop is not None:
+            return await asyncio.wrap_future(future)
+
+        if self._wakeup is None:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+
+            self._wakeup = socket.socketpair()
+            for end in self._wakeup:
+                end.setblocking(False)
+            self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+
+        task = self.current
         self.current = None
+        self._pending.add(task)
+        future.add_done_callback(lambda _: self._complete(task))
         await self.next_task()
 
-    def run_soon(self, *coros):
+        return future.result()
+
+    def _complete(self, task):
+        """Called from a worker thread when `task`'s job is done.
+        """
+        self._completed.append(task)
+        try:
+            self._wakeup[1].send(b"\0")
+        except OSError:  # The socket's buffer is full (the loop will wake anyway) or it's closed.
+            pass
+
+    def _drain_wakeup(self):
+        try:
+            while self._wakeup[0].recv(4096):
+                pass
+        except OSError:  # Nothing left to read.
+            pass
+
+    def _collect_completed(self):
+        """Schedule tasks whose executor jobs are done.
+        """
+        completed = self._completed
+        pending = self._pending
+        while completed:
+            if (task := completed.popleft()) in pending:  # Otherwise it was cleared.
+                pending.remove(task)
+                self.ready.append(task)
+
+    def shutdown_executors(self):
+        """Shut down the worker threads and processes started by `run_in_thread` and `run_in_process`.  Jobs that haven't
+        started are canceled.
+        """
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        self._thread_pool = self._process_pool = None
+
+    def _wake_readers(self, fd):
+        """Resolve the futures of tasks waiting for `fd` with `run_async`.
+        """
+        self._loop.remove_reader(fd)
+        if (timer := self._io_timers.pop(fd, None)) is not None:
+            timer.cancel()
+
+        for future in self.waiting.pop(fd):
+            _resolve(future)
+
+    def wake(self, task):
+        """Schedule a task suspended with `park` to run as soon as possible.  Does nothing if the task isn't parked.
+        """
+        if task.is_parked:
+            task.is_parked = False
+
+            if self._loop is not None:
+                self._active += 1
+                _resolve(task.waker)
+            else:
+                self.ready.append(task)
+
+    def count_tasks(self):
+        """
+        Return the number of live tasks (scheduled and not canceled) and dead tasks (canceled but not yet removed from
+        the scheduler's queues).  Parked tasks aren't counted.
+        """
+        if self._loop is not None:
+            tasks = [task for task in self._drivers if not task.is_parked]
+            dead = sum(task.is_canceled for task in tasks)
+            return len(tasks) - dead, dead
+
+        dead = self.sleeping.dead + sum(task.is_canceled for task in self.ready)
+        queued = len(self.ready) + len(self.sleeping) + sum(map(len, self.waiting.values())) + len(self._pending)
+        return queued - dead, dead
+
+    def has_tasks(self):
+        """Whether any tasks other than the current one are scheduled.  Parked tasks don't count.
+        """
+        if self._loop is not None:
+            return self._active > (self.current is not None)
+
+        return bool(self.ready or self.sleeping or self.waiting or self._pending)
+
+    def run_soon(self, *coros, priority=BACKGROUND):
         """Schedule the given coroutines to run as soon as possible.
         """
         for coro in coros:
-            self.new_task(coro)
+            self.new_task(coro, priority)
+
+    def new_task(self, coro, priority=BACKGROUND):
+        """
+        Schedule a given coroutine and return a :class: Task.  `task.cancel()` will unschedule the coroutine.
 
-    def new_task(self, coro):
-        """Schedule a given coroutine and return a :class: Task.  `task.cancel()` will unschedule the coroutine.
+        Parameters
+        ----------
+        priority: optional
+            The task's lane: INPUT, RENDER or BACKGROUND. (the default is BACKGROUND)
         """
-        self.ready.append(Task(self, coro))
-        return self.ready[-1]
+        task = Task(self, coro, priority)
+
+        if self._loop is not None:
+            self._start_driver(task)
+        else:
+            self.ready.append(task)
+
+        return task
+
+    def clear(self):
+        """Unschedule all tasks.  Their coroutines are closed.
+        """
+        if self._loop is not None:
+            self._groups.clear()
+
+            for fd in list(self.waiting):
+                self._wake_readers(fd)
+
+            for task in list(self._drivers):
+                if task is not self.current:
+                    task.cancel(close=True)
+            return
+
+        self._groups.clear()
+        self._unstarted.clear()
+
+        tasks = [*self.ready, *self.sleeping, *self._pending]
+        for fd, waiting in self.waiting.items():
+            self._selector.unregister(fd)
+            tasks.extend(waiting)
+
+        self.ready.clear()
+        self.sleeping.clear()
+        self.waiting.clear()
+        self._waiting_since.clear()
+        self._pending.clear()
+
+        for task in tasks:
+            task.coro.close()
 
     def run(self, *coros):
         """Start the event loop. All of `coros` will be scheduled with `run_soon` before the loop starts.
         """
         self.run_soon(*coros)
+        self._start_groups()
+        self._is_running = True
+        try:
+            self._run()
+        finally:
+            self._is_running = False
 
+    def _run(self):
         ready = self.ready
         sleeping = self.sleeping
+        waiting = self.waiting
+
+        while ready or sleeping or waiting or self._pending:
+            if self._pending:
+                self._collect_completed()
 
-        while ready or sleeping:
             now = monotonic()
 
-            while sleeping and sleeping[0].deadline <= now:
-                ready.append(heappop(sleeping))
+            if (stats := self.stats) is not None:
+                stats.record_depths(len(ready), len(sleeping))
+                if (deadline := sleeping.next_deadline()) is not None and deadline <= now:
+                    stats.record_lag(now - deadline)
+
+            sleeping.expire(now, ready)
 
             if ready:
-                self.current = ready.popleft()
-            else:
-                self.current = heappop(sleeping)
-                sleep(self.current.deadline - now)
+                if waiting:
+                    self._poll_io()
+            elif waiting or self._pending:
+                timeout = None if (deadline := sleeping.next_deadline()) is None else deadline - now
+                if (io_deadline := self._io_deadline()) is not None and (timeout is None or io_deadline - now < timeout):
+                    timeout = max(io_deadline - now, 0)
 
-            if self.current.is_canceled:
+                self._wait_for_io(timeout)
+                continue
+            else:
+                if (deadline := sleeping.next_deadline()) is not None:
+                    sleep(max(deadline - now, 0))
                 continue
 
-            try:
-                self.current.coro.send(None)
-            except StopIteration as e:
-                self.current.result = e.value
+            for lane, budget in zip(ready.lanes, self.budgets):
+                if not lane:
+                    continue
+
+                end = None if budget is None else monotonic() + budget
+                for _ in range(len(lane)):  # Tasks that stay ready are appended behind these and run next round.
+                    task = self.current = lane.popleft()
+                    if task.is_canceled:
+                        continue
+
+                    if stats is not None:
+                        start = perf_counter()
+
+                    try:
+                        task.coro.send(None)
+                    except StopIteration as e:
+                        task.result = e.value
+                    else:
+                        if self.current:
+                            ready.append(task)
+
+                    if stats is not None:
+                        stats.record_task(task, perf_counter() - start)
+
+                    if end is not None and monotonic() >= end:
+                        break
+
+    async def run_async(self, *coros):
+        """
+        Run the event loop on the running asyncio event loop, e.g., `asyncio.run(scheduler.run_async(*coros))`.
+        Returns when no tasks are left (parked tasks don't count).
+
+        Notes
+        -----
+        Canceling a task that is awaiting an asyncio future also cancels the future.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._done = asyncio.Event()
+        self._error = None
+
+        tasks = list(self.ready)
+        self.ready.clear()
+        for task in tasks:
+            self._start_driver(task)
+        self.run_soon(*coros)
+        self._start_groups()
+
+        try:
+            while self._active and self._error is None:
+                self._done.clear()
+                await self._done.wait()
+        finally:
+            self.clear()
+            drivers = list(self._drivers.values())
+            for driver in drivers:
+                driver.cancel()
+            await asyncio.gather(*drivers, return_exceptions=True)
+            self._loop = None
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _start_driver(self, task):
+        self._active += 1
+        self._drivers[task] = self._loop.create_task(self._drive(task))
+
+    async def _drive(self, task):
+        """Step `task` until it's done or canceled, awaiting whatever it suspends on.
+        """
+        coro = task.coro
+        error = None
+
+        try:
+            while not task.is_canceled:
+                self.current = task
+                if (stats := self.stats) is not None:
+                    start = perf_counter()
+
+                try:
+                    awaited = coro.send(None) if error is None else coro.throw(error)
+                except StopIteration as e:
+                    task.result = e.value
+                    return
+                finally:
+                    self.current = None
+                    if stats is not None:
+                        stats.record_task(task, perf_counter() - start)
+
+                error = None
+                try:
+                    if awaited is None:  # `next_task`
+                        await asyncio.sleep(0)
+                    elif asyncio.isfuture(awaited):
+                        awaited._asyncio_future_blocking = False  # As asyncio's tasks do, so it can be awaited here.
+                        await awaited
+                    else:
+                        error = RuntimeError(f"task yielded {awaited!r}, expected None or a future")
+                except asyncio.CancelledError as e:
+                    if task.is_canceled:
+                        return
+
+                    error = e  # Canceled by asyncio (e.g., a timeout); let the coroutine handle it.
+                except Exception:
+                    pass  # The coroutine gets the future's exception when it's resumed.
+        except Exception as e:
+            self._error = e
+            self._done.set()
+        finally:
+            del self._drivers[task]
+            if task.is_parked:
+                task.is_parked = False  # Nothing can wake it now.
             else:
-                if self.current:
-                    ready.append(self.current)
+                self._active -= 1
+                if self._active == 0:
+                    self._done.set()
 
     def aiter(self, iterable, *args, delay=0, n=0, **kwargs):
         """Utility function: wraps a callable in a coroutine or creates an async iterator from an iterable.
@@ -123,16 +725,128 @@ class Scheduler:
         exec(dedent(code), locals(), loc := { })
         return loc["wrapped"]()
 
-    def schedule(self, callable, *args, delay=0, n=0, **kwargs):
+    def schedule(self, callable, *args, delay=0, n=0, mode="fixed_delay", missed="skip", **kwargs):
         """
         Schedule `callable(*args, **kwargs)` every `delay` seconds.
-        Returns a :class: Task (task.cancel() can be used to unschedule `callable`).
+        Returns a :class: Callback (callback.cancel() can be used to unschedule `callable`).
 
         If `n` is non-zero, `callable` is only scheduled `n` times.
+
+        Parameters
+        ----------
+        mode: optional
+            "fixed_delay" waits `delay` seconds after each call, so the period is `delay` plus the time the calls take.
+            "fixed_rate" calls at `start + k * delay`, so the period doesn't drift under load. (the default is
+            "fixed_delay")
+
+        missed: optional
+            What a "fixed_rate" callable does when it's a period or more late: "skip" calls once and drops the missed
+            ticks, keeping the original schedule; "catch_up" makes every missed call, back to back, until it's on
+            schedule; "coalesce" calls once and restarts the schedule from now. (the default is "skip")
+
+        Notes
+        -----
+        Callables scheduled with the same delay (and, for "fixed_rate", the same `missed` policy) before their group's
+        first tick are called together, in the order they were scheduled, by a single task.  A callable scheduled after
+        that starts a new group, so every callable is first called as soon as possible and then every `delay` seconds.
+        Group tasks are only created once the loop runs.
+
+        Late ticks are counted in the returned callback's `missed_ticks` and, if stats are enabled, in
+        `SchedulerStats.missed_ticks`.
         """
-        return self.new_task(self.aiter(callable, *args, delay=delay, n=n, **kwargs))
+        if mode not in SCHEDULE_MODES:
+            raise ValueError(f"mode must be one of {SCHEDULE_MODES}, not {mode!r}")
+
+        if missed not in MISSED_TICK_POLICIES:
+            raise ValueError(f"missed must be one of {MISSED_TICK_POLICIES}, not {missed!r}")
+
+        callback = Callback(self, callable, args, kwargs, delay, n, mode, missed)
+
+        key = (delay, missed) if mode == "fixed_rate" and delay > 0 else delay
+        if (callbacks := self._groups.get(key)) is not None:
+            callbacks.append(callback)
+        else:
+            self._groups[key] = callbacks = [callback]
+            if self._is_running or self._loop is not None:
+                self.new_task(self._tick_group(key, callbacks))
+            else:
+                self._unstarted.append((key, callbacks))
+
+        return callback
+
+    def _start_groups(self):
+        """Create the tasks of groups of callbacks scheduled before the loop started.
+        """
+        for key, callbacks in self._unstarted:
+            self.new_task(self._tick_group(key, callbacks))
+        self._unstarted.clear()
+
+    async def _tick_group(self, key, callbacks):
+        """Call `callbacks` every `delay` seconds until all are canceled or done.  Groups of "fixed_rate" callbacks are
+        keyed by `(delay, missed)`.
+        """
+        if self._groups.get(key) is callbacks:
+            del self._groups[key]  # Callables scheduled from now on start a new group, on their own schedule.
+
+        delay, missed = key if isinstance(key, tuple) else (key, None)
+        deadline = monotonic()  # Of the current tick, for "fixed_rate" groups
+
+        while True:
+            late = 0
+            if missed is not None and (late := int((monotonic() - deadline) / delay)):
+                if missed == "skip":
+                    deadline += late * delay
+                elif missed == "coalesce":
+                    deadline = monotonic()
+                else:
+                    late = 1  # The missed ticks are each called, and counted, in turn.
+
+                if (stats := self.stats) is not None:
+                    stats.missed_ticks += late
+
+            survivors = [ ]
+            for callback in callbacks:
+                if callback.is_canceled:
+                    continue
+
+                callback.missed_ticks += late
+                if (stats := self.stats) is None:
+                    result = callback.callable(*callback.args, **callback.kwargs)
+                else:
+                    start = perf_counter()
+                    result = callback.callable(*callback.args, **callback.kwargs)
+                    stats.record_callback(callback, perf_counter() - start, self.current)
+
+                if callback.n == 1:
+                    callback.result = result
+                elif not callback.is_canceled:
+                    if callback.n:
+                        callback.n -= 1
+                    survivors.append(callback)
+
+            callbacks[:] = survivors
+            if not callbacks:
+                return
+
+            if missed is not None:
+                deadline += delay
+                await self.sleep(deadline - monotonic())
+            elif delay > 0:
+                await self.sleep(delay)
+            else:
+                await self.next_task()
 
     @staticmethod
     @coroutine
     def next_task():
         yield
+
+    @staticmethod
+    @coroutine
+    def _suspend(future):
+        yield future
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
@@ -1,68 +1,305 @@
 import curses
+import string
+from time import monotonic, perf_counter
 
+from .color_manager import ColorManager
 from .meta import Singleton
-from .scheduler import Scheduler
+from .scheduler import Scheduler, INPUT, RENDER
+from ..backends import CursesBackend
 from ..widgets import Root
-from .. import ESCAPE
+from .. import ESCAPE, KeyRepeat, Paste
+from ..mouse import MouseEvent, PRESS, RELEASE, CLICK, DRAG, MOVE
 
 EXIT = ESCAPE
+MAX_KEYS_PER_TICK = 1024  # Any more are read next tick, so a flood of input can't hold up the loop.
+PASTE_START = [27, 91, 50, 48, 48, 126]  # ESC [ 2 0 0 ~
+PASTE_END = [27, 91, 50, 48, 49, 126]  # ESC [ 2 0 1 ~
+TEXT_KEYS = frozenset(map(ord, string.printable))
+ESCAPE_DELAY = .05  # Seconds to wait for the rest of an escape sequence split between reads
 
 
 class ScreenManager(Scheduler, metaclass=Singleton):
     """
-    ScreenManager starts and closes curses, handles events (getching for now, hopefully mouse
-    input in the future), and schedules and runs coroutines.
+    ScreenManager starts and closes the backend (curses by default), handles events (key presses and mouse events), and
+    schedules and runs coroutines.
+
+    Parameters
+    ----------
+    backend: optional
+        The backend that renders frames and provides input. Only used the first time ScreenManager is instantiated.
+        (the default is a new :class: CursesBackend; use :class: HeadlessBackend to run without a terminal)
+
+    timers: optional
+        The queue of sleeping tasks, see :class: Scheduler. Only used the first time ScreenManager is instantiated.
+        (the default is a new :class: TimerHeap)
+
+    Notes
+    -----
+    The screen is redrawn by a frame clock: widgets (or anything else) call `request_redraw` and the root is refreshed
+    at most once per frame, at most `fps` times a second.  If nothing requests a redraw, no frames are drawn.
+
+    While idle, the getch loop waits on the backend's file descriptor (if it has one) rather than polling, so the loop
+    sleeps until a key is pressed or a task's deadline is due.  Resizes don't make the terminal readable, so the wait is
+    cut short every `io_timeout` seconds to check for them.
+
+    Each tick, the getch loop reads every pending key and dispatches them in order.  If `coalesce_keys` is a collection
+    of keys (e.g., `NAVIGATION_KEYS`), runs of the same key from it are dispatched once as a :class: KeyRepeat with a
+    count; :class: Movable and :class: Scrollable apply a repeat as one batched step.
+
+    Bracketed pastes (see :class: CursesBackend) and runs of at least `paste_burst` text keys read in one tick are
+    dispatched as a single :class: Paste, so text widgets insert them in one edit rather than a key at a time.  A paste
+    longer than a tick's keys is gathered over as many ticks as it takes.  Set `paste_burst` to 0 to only decode bracketed
+    pastes.  Keys that could start a paste (e.g., an EXIT that's the last key read) are held back until the next read,
+    or for at most `ESCAPE_DELAY` seconds, in case the rest of the sequence is still on its way.
+
+    Mouse events (with `CursesBackend(mouse=True)`) are sent to the topmost widget under the pointer, see `dispatch_mouse`.
+
+    The getch loop runs in the INPUT lane and the frame clock in the RENDER lane, so key presses are handled, and the
+    screen redrawn, before background tasks run (see :class: Scheduler).
     """
 
-    __slots__ = "screen", "root"
+    __slots__ = (
+        "backend", "root", "fps", "coalesce_keys", "paste_burst", "_frame_task", "_redraw_requested", "_mouse_press",
+        "_paste", "_held", "_held_since", "_input_waiters",
+    )
+
+    def __init__(self, backend=None, timers=None):
+        self.backend = backend = CursesBackend() if backend is None else backend
+        ColorManager().backend = backend
+
+        self.root = Root(backend)  # Top-level widget: getch dispatching will start here.
 
-    def __init__(self):
-        self.screen = screen = curses.initscr()
-        screen.keypad(True)
-        screen.nodelay(True)
-        curses.cbreak()
-        curses.noecho()
-        curses.curs_set(0)
-        curses.start_color()
+        self.fps = 30  # Target frames per second
+        self.coalesce_keys = ()  # Keys whose repeats are dispatched as a single KeyRepeat
+        self.paste_burst = 32  # Minimum length of a run of text keys read in one tick that's dispatched as a Paste
+        self._frame_task = None
+        self._redraw_requested = True  # Draw the first frame as soon as we run.
+        self._mouse_press = None  # (widget, button) of the last mouse press until it's released
+        self._paste = None  # Keys of a bracketed paste that hasn't ended yet
+        self._held = [ ]  # Keys that may start a paste, held back until more keys are read
+        self._held_since = None
+        self._input_waiters = set()  # Tasks parked by `wait_for_input`
 
-        self.root = Root(screen=screen)  # Top-level widget: getch dispatching will start here.
+        super().__init__(timers)
+        self.io_timeout = .1
 
-        super().__init__()
+    def request_redraw(self):
+        """Redraw the screen on the next frame.  Any number of requests before then are coalesced into a single refresh.
+        """
+        self._redraw_requested = True
+
+        if self._frame_task is not None:
+            self.wake(self._frame_task)
+
+    async def wait_for_input(self):
+        """
+        Park the current task until it's passed to `wake` (e.g., by a widget's `on_press`).  Unlike `park`, the getch
+        loop keeps running while the task waits, even if no other tasks are scheduled.
+        """
+        task = self.current
+        self._input_waiters.add(task)
+        try:
+            await self.park()
+        finally:
+            self._input_waiters.discard(task)
+
+    def _is_waiting_for_input(self):
+        return any(not task.is_canceled for task in self._input_waiters)
+
+    async def frame_clock(self):
+        while True:
+            if not self._redraw_requested:
+                await self.park()
+
+            self._redraw_requested = False
+            if (stats := self.stats) is None:
+                self.root.refresh()
+            else:
+                start = perf_counter()
+                self.root.refresh()
+                stats.record_refresh(perf_counter() - start)
+            await self.sleep(1 / self.fps)
 
     def pause(self):
         """A blocking getch.
         """
-        screen = self.screen
-        screen.nodelay(False)
-        key = screen.getch()
-        screen.nodelay(True)
-        return key
+        return self.backend.pause()
+
+    async def getch(self, until_exit=False):
+        backend = self.backend
 
-    async def getch(self):
         while True:
-            if not self.ready and not self.sleeping:
+            if not until_exit and not self.has_tasks() and not self._is_waiting_for_input():
                 return
 
-            key = self.screen.getch()
-            if key == EXIT:
-                self.ready.clear()
-                self.sleeping.clear()
-                return
+            key = self._read_key()
+            if key == curses.ERR:
+                if not self._held:
+                    if (fd := backend.fileno()) is not None:
+                        await self.wait_readable(fd)
+                    else:
+                        await self.next_task()
+                    continue
+
+                if monotonic() - self._held_since < ESCAPE_DELAY:
+                    await self.sleep(ESCAPE_DELAY)
+                    continue
+
+                keys, self._held = self._held, [ ]  # The sequence never finished; dispatch the keys as they are.
+            else:
+                keys = [*self._held, key]
+                self._held = [ ]
+                while len(keys) < MAX_KEYS_PER_TICK and (key := self._read_key()) != curses.ERR:
+                    keys.append(key)  # Drain keys pressed since the last tick.
+
+                if self._paste is not None or ESCAPE in keys:
+                    keys = self._decode_pastes(keys)
+                    if self._paste is None:
+                        keys = self._hold_paste_start(keys)
+            if self.paste_burst and len(keys) >= self.paste_burst:
+                keys = _bursts(keys, self.paste_burst)
 
-            if key == curses.KEY_RESIZE:
-                self.root.update_geometry()
-            elif key != curses.ERR:
-                self.root.dispatch(key)
-                curses.flushinp()
+            for key in _coalesce(keys, self.coalesce_keys) if self.coalesce_keys else keys:
+                if isinstance(key, MouseEvent):
+                    if self.dispatch_mouse(key):
+                        self.request_redraw()
+                elif key == EXIT:
+                    self.clear()
+                    return
+                elif key == curses.KEY_RESIZE:
+                    self.root.update_geometry()
+                    self.request_redraw()
+                elif self.dispatch(key):
+                    self.request_redraw()
 
             await self.next_task()
 
-    def run(self, *coros, getch=True):
-        if getch:
-            self.run_soon(self.getch())
+    def _read_key(self):
+        """The next key from the backend, or a :class: MouseEvent.
+        """
+        backend = self.backend
+        while (key := backend.getch()) == curses.KEY_MOUSE:
+            if (event := backend.getmouse()) is not None:
+                return event
+
+        return key
+
+    def _decode_pastes(self, keys):
+        """Replace bracketed pastes in `keys` with a :class: Paste.  An unfinished paste is kept for the next tick.
+        """
+        decoded = [ ]
+        paste = self._paste
+
+        for key in keys:
+            if paste is not None:
+                paste.append(key)
+                if key == 126 and paste[-6:] == PASTE_END:
+                    del paste[-6:]
+                    decoded.append(_paste_text(paste))
+                    paste = None
+            else:
+                decoded.append(key)
+                if key == 126 and decoded[-6:] == PASTE_START:
+                    del decoded[-6:]
+                    paste = [ ]
+
+        self._paste = paste
+        return decoded
+
+    def _hold_paste_start(self, keys):
+        """Hold back keys at the end of `keys` that are the start of `PASTE_START`; return the rest.
+        """
+        for n in range(min(len(PASTE_START) - 1, len(keys)), 0, -1):
+            if keys[-n:] == PASTE_START[:n]:
+                self._held = keys[-n:]
+                self._held_since = monotonic()
+                return keys[:-n]
+
+        return keys
+
+    def dispatch_mouse(self, event):
+        """
+        Send a :class: MouseEvent to the topmost widget under the pointer; it bubbles up to the widget's ancestors until
+        it's handled.  Returns whether it was.
+
+        Notes
+        -----
+        After a PRESS, moves become DRAGs and they and the RELEASE go to the pressed widget.  If the pointer is released
+        over the pressed widget, a CLICK follows the RELEASE.
+        """
+        press = self._mouse_press
+
+        if press is not None and event.type in (MOVE, RELEASE):
+            widget, button = press
+            if event.type == MOVE:
+                event.type = DRAG
+            event.button = button
+        else:
+            widget = self.root.widget_at(event.y, event.x)
+
+        if event.type == PRESS:
+            self._mouse_press = widget, event.button
+
+        handled = _bubble(widget, event)
+
+        if event.type == RELEASE:
+            self._mouse_press = None
+            if press is not None and self.root.widget_at(event.y, event.x) is widget:
+                handled |= _bubble(widget, MouseEvent(CLICK, event.y, event.x, event.button))
+
+        return handled
+
+    def dispatch(self, key):
+        """
+        Dispatch `key` with the root's :class: FocusManager.  Returns whether it was handled.
+
+        A :class: KeyRepeat that is handled but not consumed is dispatched again, as a plain key, for each remaining press.
+        A :class: Paste that isn't handled is dispatched as a key press per character.
+        """
+        focus = self.root.focus
+        if not focus.dispatch(key):
+            if isinstance(key, Paste):
+                return any([focus.dispatch(ord(char)) for char in key])
+            return False
 
+        if isinstance(key, KeyRepeat) and not key.is_consumed:
+            for _ in range(key.count - 1):
+                focus.dispatch(int(key))
+
+        return True
+
+    def run(self, *coros, getch=True, until_exit=False):
+        """
+        Start the event loop with the getch loop and the frame clock.
+
+        Parameters
+        ----------
+        getch: optional
+            Whether to read and dispatch key presses. (the default is True)
+
+        until_exit: optional
+            By default the getch loop stops when no other tasks are scheduled; if true, it runs until the EXIT key is
+            pressed. (the default is False)
+        """
+        self._start(getch, until_exit)
         super().run(*coros)
 
+    async def run_async(self, *coros, getch=True, until_exit=False):
+        """
+        Like `run`, but runs on the running asyncio event loop so tasks can await asyncio awaitables (sockets,
+        subprocesses, ...), e.g., `asyncio.run(sm.run_async(*coros))`.  Keys are read with `loop.add_reader`.
+        """
+        self._start(getch, until_exit)
+        await super().run_async(*coros)
+
+    def _start(self, getch, until_exit):
+        if getch:
+            self.run_soon(self.getch(until_exit), priority=INPUT)
+
+        if self._frame_task is not None:  # Left parked by a previous run.
+            self._frame_task.cancel(close=True)
+        self._frame_task = self.new_task(self.frame_clock(), RENDER)
+
     def __enter__(self):
         return self
 
@@ -70,8 +307,62 @@ class ScreenManager(Scheduler, metaclass=Singleton):
         self.close()
 
     def close(self):
-        self.screen.keypad(False)
-        curses.nocbreak()
-        curses.echo()
-        curses.flushinp()
-        curses.endwin()
+        self.shutdown_executors()
+        self.backend.close()
+
+
+def _bubble(widget, event):
+    """Send `event` to `widget` and then its ancestors until one handles it.
+    """
+    while widget is not None:
+        if widget.on_mouse(event):
+            return True
+        widget = widget.parent
+
+    return False
+
+
+def _paste_text(keys):
+    """Decode the keys of a paste (utf-8 encoded bytes) to a :class: Paste; line endings become newlines.
+    """
+    text = bytes(key for key in keys if isinstance(key, int) and 0 <= key < 256).decode(errors="replace")
+    return Paste(text.replace("\r\n", "\n").replace("\r", "\n"))
+
+
+def _bursts(keys, min_length):
+    """Replace runs of at least `min_length` text keys with a :class: Paste.
+    """
+    decoded = [ ]
+    start = 0
+    for i, key in enumerate(keys):
+        if key in TEXT_KEYS:
+            continue
+
+        if i - start >= min_length:
+            decoded.append(_paste_text(keys[start: i]))
+        else:
+            decoded.extend(keys[start: i])
+        decoded.append(key)
+        start = i + 1
+
+    if len(keys) - start >= min_length:
+        decoded.append(_paste_text(keys[start:]))
+    else:
+        decoded.extend(keys[start:])
+
+    return decoded
+
+
+def _coalesce(keys, coalesced):
+    """Replace runs of the same key in `coalesced` with a :class: KeyRepeat.
+    """
+    i = 0
+    while i < len(keys):
+        key = keys[i]
+        j = i + 1
+        if key in coalesced:
+            while j < len(keys) and keys[j] == key:
+                j += 1
+
+        yield key if j - i == 1 else KeyRepeat(key, j - i)
+        i = j
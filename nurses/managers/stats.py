@@ -0,0 +1,123 @@
+class SchedulerStats:
+    """
+    Counters collected by a :class: Scheduler while its `stats` is set (see `Scheduler.enable_stats`).
+
+    Attributes
+    ----------
+    tasks:
+        task -> [run time in seconds, number of times resumed], for every task stepped since the last `reset`.  Callables
+        scheduled with `Scheduler.schedule` are counted on their own (their :class: Callback -> [run time, calls]) rather
+        than as part of the task that calls them.
+
+    lag, max_lag, lag_samples:
+        How late the loop got to the earliest due sleeping task, in seconds: the latest sample, the largest and the number
+        of samples.  A sample is taken each time the loop finds a deadline has passed.
+
+    ready_depth, sleeping_depth, max_ready_depth, max_sleeping_depth:
+        Length of the ready and sleeping queues at the latest loop iteration and the largest seen.
+
+    refresh_time, max_refresh_time, refreshes:
+        Total and longest time spent in `Root.refresh` and the number of refreshes (only recorded by :class:
+        ScreenManager).
+
+    missed_ticks:
+        Number of ticks of "fixed_rate" callbacks (see `Scheduler.schedule`) that came a period or more late.
+
+    iterations:
+        Number of loop iterations.
+
+    Notes
+    -----
+    Lag and queue depths are only measured by `Scheduler.run`; with `run_async` asyncio owns the queues.
+    """
+    __slots__ = (
+        "tasks", "lag", "max_lag", "total_lag", "lag_samples",
+        "ready_depth", "sleeping_depth", "max_ready_depth", "max_sleeping_depth",
+        "refresh_time", "max_refresh_time", "refreshes", "missed_ticks", "iterations",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero all counters.
+        """
+        self.tasks = { }
+        self.lag = self.max_lag = self.total_lag = 0.0
+        self.lag_samples = 0
+        self.ready_depth = self.sleeping_depth = self.max_ready_depth = self.max_sleeping_depth = 0
+        self.refresh_time = self.max_refresh_time = 0.0
+        self.refreshes = 0
+        self.missed_ticks = 0
+        self.iterations = 0
+
+    def record_task(self, task, elapsed):
+        if (entry := self.tasks.get(task)) is None:
+            self.tasks[task] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+
+    def record_callback(self, callback, elapsed, task):
+        """Record a call of a scheduled `callback` made by `task`; the time is moved from `task` to `callback`.
+        """
+        self.record_task(callback, elapsed)
+        self.tasks.setdefault(task, [0.0, 0])[0] -= elapsed
+
+    def record_lag(self, lag):
+        self.lag = lag
+        self.total_lag += lag
+        self.lag_samples += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+    def record_depths(self, ready, sleeping):
+        self.iterations += 1
+        self.ready_depth = ready
+        self.sleeping_depth = sleeping
+        if ready > self.max_ready_depth:
+            self.max_ready_depth = ready
+        if sleeping > self.max_sleeping_depth:
+            self.max_sleeping_depth = sleeping
+
+    def record_refresh(self, elapsed):
+        self.refresh_time += elapsed
+        self.refreshes += 1
+        if elapsed > self.max_refresh_time:
+            self.max_refresh_time = elapsed
+
+    @property
+    def mean_lag(self):
+        return self.total_lag / self.lag_samples if self.lag_samples else 0.0
+
+    @property
+    def mean_refresh_time(self):
+        return self.refresh_time / self.refreshes if self.refreshes else 0.0
+
+    def top_tasks(self, n=5):
+        """
+        The `n` tasks with the most run time, as (name, run time, resumes) tuples.  A task's name is its coroutine's
+        (or a callback's callable's) qualified name.
+        """
+        entries = sorted(self.tasks.items(), key=lambda item: item[1][0], reverse=True)[:n]
+        return [(_task_name(task), time, resumes) for task, (time, resumes) in entries]
+
+    def summary(self, n=5):
+        """Lines of text describing the counters and the top `n` tasks; used by :class: StatsOverlay.
+        """
+        lines = [
+            f"lag    {self.lag * 1e3:7.2f}ms  mean {self.mean_lag * 1e3:6.2f}  max {self.max_lag * 1e3:6.2f}",
+            f"ready  {self.ready_depth:7}    max {self.max_ready_depth:6}  missed ticks {self.missed_ticks}",
+            f"sleep  {self.sleeping_depth:7}    max {self.max_sleeping_depth:6}",
+            f"frame  {self.mean_refresh_time * 1e3:7.2f}ms  max {self.max_refresh_time * 1e3:6.2f}  n {self.refreshes}",
+        ]
+
+        for name, time, resumes in self.top_tasks(n):
+            lines.append(f"{time * 1e3:9.1f}ms {resumes:7} {name}")
+
+        return lines
+
+
+def _task_name(task):
+    target = task.callable if hasattr(task, "callable") else task.coro
+    return getattr(target, "__qualname__", repr(target))
@@ -0,0 +1,248 @@
+from heapq import heapify, heappop, heappush
+from math import ceil
+
+MIN_DEAD_TO_COMPACT = 64  # Canceled tasks are only purged from a heap once there are at least this many.
+
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SLOTS - 1
+
+
+class TimerHeap:
+    """
+    The :class: Scheduler's default queue of sleeping tasks: a binary heap ordered by deadline.  Pushing and expiring a
+    task are O(log n).
+
+    Notes
+    -----
+    Canceled tasks are counted as `dead`; once they make up more than half the heap it's rebuilt without them.
+    """
+    __slots__ = "_heap", "dead"
+
+    def __init__(self):
+        self._heap = [ ]
+        self.dead = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return iter(self._heap)
+
+    def push(self, task):
+        task.is_sleeping = True
+        heappush(self._heap, task)
+
+    def next_deadline(self):
+        """Time of the earliest deadline or None if there are no tasks.  Canceled tasks are dropped first.
+        """
+        heap = self._heap
+        while heap and heap[0].is_canceled:
+            heappop(heap).is_sleeping = False
+            self.dead -= 1
+
+        return heap[0].deadline if heap else None
+
+    def expire(self, now, ready):
+        """Move tasks whose deadlines have passed onto `ready`; canceled tasks are dropped.
+        """
+        heap = self._heap
+        while heap and heap[0].deadline <= now:
+            task = heappop(heap)
+            task.is_sleeping = False
+            if task.is_canceled:
+                self.dead -= 1
+            else:
+                ready.append(task)
+
+    def discard(self, task):
+        """Note that a sleeping task was canceled.
+        """
+        self.dead += 1
+
+        heap = self._heap
+        if self.dead >= MIN_DEAD_TO_COMPACT and 2 * self.dead > len(heap):
+            for task in heap:
+                if task.is_canceled:
+                    task.is_sleeping = False
+
+            heap[:] = [task for task in heap if not task.is_canceled]
+            heapify(heap)
+            self.dead = 0
+
+    def clear(self):
+        for task in self._heap:
+            task.is_sleeping = False
+
+        self._heap.clear()
+        self.dead = 0
+
+
+class TimingWheel:
+    """
+    A hierarchical timing wheel, an alternative queue of sleeping tasks for :class: Scheduler.  Pushing and expiring
+    a task are O(1), but deadlines are rounded up to a multiple of `resolution`.
+
+    Parameters
+    ----------
+    resolution: optional
+        Length of a tick in seconds; tasks wake up to a tick late. (the default is .001)
+
+    levels: optional
+        Number of wheels.  Each has 64 slots and each slot of a wheel spans a full turn of the wheel below it, so
+        deadlines up to `resolution * 64**levels` seconds away are placed directly; later deadlines wait in an overflow
+        list until the top wheel turns. (the default is 4)
+
+    Notes
+    -----
+    Each tick, the slot for that tick on the lowest wheel is expired.  When a wheel completes a turn, the next slot of
+    the wheel above is emptied and its tasks are spread over the wheels below it (a cascade).  Canceled tasks are
+    dropped when their slot is expired or cascaded.
+
+    Examples
+    --------
+    >>> sm = ScreenManager(timers=TimingWheel(resolution=.005))
+    """
+    __slots__ = "resolution", "dead", "_wheels", "_overflow", "_tick", "_len"
+
+    def __init__(self, resolution=.001, levels=4):
+        self.resolution = resolution
+        self.dead = 0
+        self._wheels = [[[ ] for _ in range(WHEEL_SLOTS)] for _ in range(levels)]
+        self._overflow = [ ]
+        self._tick = None  # The last expired tick; set on the first `expire`
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for wheel in self._wheels:
+            for slot in wheel:
+                yield from slot
+
+        yield from self._overflow
+
+    def push(self, task):
+        task.is_sleeping = True
+        self._len += 1
+        self._place(task, max(ceil(task.deadline / self.resolution), self._tick + 1))
+
+    def _place(self, task, tick):
+        """Put `task` on the lowest wheel whose current turn contains `tick`.
+        """
+        current = self._tick
+        shift = 0
+        for wheel in self._wheels:
+            if tick >> shift + WHEEL_BITS == current >> shift + WHEEL_BITS:
+                wheel[tick >> shift & WHEEL_MASK].append(task)
+                return
+            shift += WHEEL_BITS
+
+        self._overflow.append(task)
+
+    def next_deadline(self):
+        """
+        Time of the earliest occupied tick or None if there are no tasks.
+
+        Notes
+        -----
+        For tasks on the upper wheels this is the time their slot is cascaded, which may be earlier than their deadlines.
+        """
+        if not self._len:
+            return None
+
+        return self._next_tick() * self.resolution
+
+    def _next_tick(self):
+        """The first tick after the current one with an occupied slot, on any wheel.
+        """
+        current = self._tick
+        shift = 0
+        for wheel in self._wheels:
+            turn = current >> shift + WHEEL_BITS << WHEEL_BITS
+            for index in range((current >> shift & WHEEL_MASK) + 1, WHEEL_SLOTS):
+                if wheel[index]:
+                    return turn + index << shift
+            shift += WHEEL_BITS
+
+        return (current >> shift) + 1 << shift  # Only overflow is left; it's placed when the top wheel turns.
+
+    def expire(self, now, ready):
+        """Move tasks whose ticks have passed onto `ready`; canceled tasks are dropped.
+        """
+        target = int(now / self.resolution + 1e-6)  # Round up a hair so that `now == next_deadline()` reaches its tick.
+
+        if self._tick is None:
+            self._tick = target
+            return
+
+        lowest = self._wheels[0]
+        while self._tick < target:
+            if not self._len or (tick := self._next_tick()) > target:
+                # Nothing happens before `target`; empty slots don't need to be visited.
+                self._tick = target
+                return
+
+            self._tick = tick
+            index = tick & WHEEL_MASK
+
+            if index == 0:
+                self._cascade(tick)
+
+            if slot := lowest[index]:
+                lowest[index] = [ ]
+                self._len -= len(slot)
+                for task in slot:
+                    task.is_sleeping = False
+                    if task.is_canceled:
+                        self.dead -= 1
+                    else:
+                        ready.append(task)
+
+    def _cascade(self, tick):
+        """The lowest wheel completed a turn; spread the tasks of the upper wheels' slots that start now downwards.
+        """
+        # Find the highest wheel that turns, then cascade from it down so that tasks can move down more than one wheel.
+        wheels = self._wheels
+        top = 1
+        while top < len(wheels) and tick >> WHEEL_BITS * top & WHEEL_MASK == 0:
+            top += 1
+
+        if top == len(wheels):
+            tasks, self._overflow = self._overflow, [ ]
+            self._replace(tasks, tick)
+            top -= 1
+
+        for level in range(top, 0, -1):
+            wheel = wheels[level]
+            index = tick >> WHEEL_BITS * level & WHEEL_MASK
+            tasks, wheel[index] = wheel[index], [ ]
+            self._replace(tasks, tick)
+
+    def _replace(self, tasks, tick):
+        resolution = self.resolution
+        for task in tasks:
+            if task.is_canceled:
+                task.is_sleeping = False
+                self.dead -= 1
+                self._len -= 1
+            else:
+                self._place(task, max(ceil(task.deadline / resolution), tick))
+
+    def discard(self, task):
+        """Note that a sleeping task was canceled; it's dropped when its slot is reached.
+        """
+        self.dead += 1
+
+    def clear(self):
+        for task in self:
+            task.is_sleeping = False
+
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+
+        self._overflow.clear()
+        self._len = 0
+        self.dead = 0
@@ -0,0 +1,70 @@
+import curses
+
+# Mouse event types
+PRESS = "press"
+RELEASE = "release"
+CLICK = "click"
+DRAG = "drag"
+MOVE = "move"
+WHEEL_UP = "wheel_up"
+WHEEL_DOWN = "wheel_down"
+
+_BUTTONS = (
+    (1, curses.BUTTON1_PRESSED, curses.BUTTON1_RELEASED, curses.BUTTON1_CLICKED),
+    (2, curses.BUTTON2_PRESSED, curses.BUTTON2_RELEASED, curses.BUTTON2_CLICKED),
+    (3, curses.BUTTON3_PRESSED, curses.BUTTON3_RELEASED, curses.BUTTON3_CLICKED),
+)
+_WHEEL_UP = curses.BUTTON4_PRESSED
+_WHEEL_DOWN = getattr(curses, "BUTTON5_PRESSED", 0)  # Only with ncurses 6+
+
+
+class MouseEvent:
+    """
+    A decoded mouse event, dispatched to widgets' `on_mouse`.
+
+    Attributes
+    ----------
+    type:
+        One of PRESS, RELEASE, CLICK, DRAG, MOVE, WHEEL_UP or WHEEL_DOWN.
+
+    y, x:
+        Screen coordinates of the pointer; use `Widget.to_local` for coordinates relative to a widget.
+
+    button:
+        1, 2 or 3 (left, middle, right) or 0 for wheel events and moves with no button held.
+
+    Notes
+    -----
+    A RELEASE over the widget that got the PRESS is followed by a CLICK.  DRAG and RELEASE events go to the widget that
+    got the PRESS, wherever the pointer is.
+    """
+    __slots__ = "type", "y", "x", "button"
+
+    def __init__(self, type, y, x, button=0):
+        self.type = type
+        self.y = y
+        self.x = x
+        self.button = button
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.type!r}, {self.y}, {self.x}, button={self.button})"
+
+    @classmethod
+    def from_curses(cls, y, x, bstate):
+        """Decode the button state of a `curses.getmouse()`.
+        """
+        if bstate & _WHEEL_UP:
+            return cls(WHEEL_UP, y, x)
+
+        if bstate & _WHEEL_DOWN:
+            return cls(WHEEL_DOWN, y, x)
+
+        for button, pressed, released, clicked in _BUTTONS:
+            if bstate & pressed:
+                return cls(PRESS, y, x, button)
+            if bstate & released:
+                return cls(RELEASE, y, x, button)
+            if bstate & clicked:
+                return cls(CLICK, y, x, button)
+
+        return cls(MOVE, y, x)
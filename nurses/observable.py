@@ -1,4 +1,4 @@
-from collections import defaultdict
+from weakref import WeakKeyDictionary, WeakSet, ref
 
 NO_DEFAULT = object()
 
@@ -9,34 +9,45 @@ class Observable:
 
     Notes
     -----
-    We store method names instead of methods themselves.  This so we can dynamically patch methods on widgets and the new
-    method will be called.
+    Methods are bound by name, per class (see `bind`).  The first time an instance of a class is set, the names bound by
+    the class and its bases are compiled into a dispatch table of the class's functions, so later sets call the functions
+    directly.  A method patched onto an instance is looked up in the instance's `__dict__` and called instead.  Binding
+    methods invalidates the observable's tables, and patching a method onto a class with the :class: Observer metaclass
+    invalidates every observable's tables (see `invalidate_all`), so patched methods are still called.
 
     Instances that want to use a custom __get__ simply need to add the getter (a no-argument callable) to `getters`.
-    (e.g., `observable.getters[my_instance] = getter`)
+    (e.g., `observable.getters[my_instance] = getter`)  `getters` is weak-keyed, so registering a getter doesn't keep an
+    instance alive (unless the getter itself references the instance).
     """
+    instances = WeakSet()
+
     def __init__(self, default=NO_DEFAULT):
         self.default = default
-        self.methods = defaultdict(dict)
-        self.callbacks = { }
-        self.getters = { }
+        self.methods = { }  # class -> names of methods the class binds
+        self.callbacks = { }  # class -> dispatch table, a list of (name, function) pairs
+        self.getters = WeakKeyDictionary()
+        Observable.instances.add(self)
 
     def __set_name__(self, owner, name):
         self.name = name
 
     def __set__(self, instance, value):
         instance.__dict__[self.name] = value
-        self.dispatch(instance)
+        if self.methods:
+            self.dispatch(instance)
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        if instance in self.getters:
-            return self.getters[instance]()
+        # `WeakKeyDictionary.get` and `len` are slow python methods; look in the underlying dict of weak references.
+        if (getters := self.getters.data) and (getter := getters.get(ref(instance))) is not None:
+            return getter()
 
-        if self.name in instance.__dict__:
+        try:
             return instance.__dict__[self.name]
+        except KeyError:
+            pass
 
         if self.default is not NO_DEFAULT:
             return self.default
@@ -44,16 +55,40 @@ class Observable:
         return self
 
     def dispatch(self, instance):
-        # Build list of dispatches from _mro_ if it doesn't exist
-        name = type(instance).__name__
-        if name not in self.callbacks:
-            d = { }
-            for base in reversed(type(instance).__mro__):
-                d.update(self.methods.get(base.__name__, { }))
-            self.callbacks[name] = list(d)
-
-        for callback in self.callbacks[name]:
-            getattr(instance, callback)()
-
-    def bind(self, class_name, method_name):
-        self.methods[class_name][method_name] = None
+        cls = type(instance)
+        if (callbacks := self.callbacks.get(cls)) is None:
+            callbacks = self.callbacks[cls] = self._compile(cls)
+
+        attrs = instance.__dict__
+        for name, callback in callbacks:
+            if name in attrs:  # Patched onto the instance.
+                attrs[name]()
+            else:
+                callback(instance)
+
+    def _compile(self, cls):
+        """
+        The dispatch table of `cls`: names and functions of the methods bound by it and its bases (bases first), looked up
+        on `cls`.
+        """
+        names = { }
+        for base in reversed(cls.__mro__):
+            names.update(self.methods.get(base, { }))
+
+        return [(name, getattr(cls, name)) for name in names]
+
+    def bind(self, owner, method_name):
+        self.methods.setdefault(owner, { })[method_name] = None
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the compiled dispatch tables; they're rebuilt on the next set.
+        """
+        self.callbacks.clear()
+
+    @classmethod
+    def invalidate_all(cls):
+        """Forget the compiled dispatch tables of every observable.
+        """
+        for observable in cls.instances:
+            observable.invalidate()
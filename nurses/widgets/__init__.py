@@ -1,4 +1,5 @@
 from .widget import Widget
+from .focus_manager import FocusManager
 
 # Widgets
 from .root import Root
@@ -16,6 +17,7 @@ from .textbox import Textbox
 from .text_pad import TextPad
 
 from .chart import Chart
+from .stats_overlay import StatsOverlay
 
 # Layouts
 from .grid import Grid
@@ -159,3 +159,4 @@ class AnalogClock(Widget):
             )
 
         super().refresh()
+        self.is_dirty = True  # The time is always changing; redraw every frame.
@@ -15,6 +15,13 @@ class ArrayPad(ArrayWin):
 
     min_row, min_col: optional
         the upper left corner of the pad region to be displayed (default is 0)
+
+    Notes
+    -----
+    Writes through `__setitem__`, and changes to `min_row` or `min_col`, mark the widget dirty.  Writes directly to
+    `pad` or `pad_colors` should be followed by `request_redraw`.
+
+    `pad` and `pad_colors` use the widget's `char_dtype`, `color_dtype` and `packed` options (see :class: ArrayWin).
     """
 
     left_scrollbar = False
@@ -52,11 +59,10 @@ class ArrayPad(ArrayWin):
             cols = self.__dict__["cols"] = self.width if self._cols is None else self._cols
             del self._rows
             del self._cols
-            self.pad = np.full((rows, cols), self.default_character)
-            self.pad_colors = np.full((rows, cols), self.color)
+            self.pad, self.pad_colors = self._new_cells(rows, cols)
 
     def __getitem__(self, key):
-        return self.pad[key]
+        return self._decode(self.pad[key])
 
     def __setitem__(self, key, text):
         """
@@ -72,11 +78,15 @@ class ArrayPad(ArrayWin):
         elif len(text) > 1:
             text = np.array(tuple(text))
 
+        text = self._encode(text)
+
         try:
             self.pad[key] = text
         except ValueError:
             self.pad[key] = np.rot90(text if len(text.shape) == 2 else text[None, ], -1)  # Try to fit the text vertically
 
+        self.request_redraw()
+
     def push(self):
         """Write the buffers to the window.
         """
@@ -94,16 +104,16 @@ class ArrayPad(ArrayWin):
         self.colors[top: top + min_h, left: left + min_w] = self.pad_colors[min_row: min_row + min_h, min_col: min_col + min_w]
 
         if top:
-            self.buffer[0, left: -right or None] = self._bar(vertical=False)
+            self.buffer[0, left: -right or None] = self._encode(self._bar(vertical=False))
             self.colors[0, left: -right or None] = self.bar_color
         if bottom:
-            self.buffer[-1, left: -right or None] = self._bar(vertical=False)
+            self.buffer[-1, left: -right or None] = self._encode(self._bar(vertical=False))
             self.colors[-1, left: -right or None] = self.bar_color
         if left:
-            self.buffer[top: -bottom or None, 0] = self._bar()
+            self.buffer[top: -bottom or None, 0] = self._encode(self._bar())
             self.colors[top: -bottom or None, 0] = self.bar_color
         if right:
-            self.buffer[top: -bottom or None, -1] = self._bar()
+            self.buffer[top: -bottom or None, -1] = self._encode(self._bar())
             self.colors[top: -bottom or None, -1] = self.bar_color
 
         super().push()
@@ -133,30 +143,27 @@ class ArrayPad(ArrayWin):
         rows, cols = self.rows, self.cols
         min_rows, min_cols = min(rows, old_rows), min(cols, old_cols)
 
-        new_pad = np.full((rows, cols), self.default_character)
+        new_pad, new_pad_colors = self._new_cells(rows, cols)
         new_pad[:min_rows, :min_cols] = self.pad[:min_rows, :min_cols]
-
-        new_pad_colors = np.full((rows, cols), self.color)
         new_pad_colors[:min_rows, :min_cols] = self.pad_colors[:min_rows, :min_cols]
 
         self.pad = new_pad
         self.pad_colors = new_pad_colors
+        self.request_redraw()
 
-    def refresh(self):
-        """Redraw widget.
-        """
-        self.push()
+    @bind_to("min_row", "min_col")
+    def _scroll_pad(self):
+        self.request_redraw()
 
-        h, w = self.height, self.width
-        for widget in self.children:
-            if widget is None:
-                continue
+    def _child_region(self, widget):
+        # Children are positioned relative to the pad, not the widget.
+        y, x = widget.top - self.min_row, widget.left - self.min_col
+        src_t, des_t = (-y, 0) if y < 0 else (0, y)
+        src_l, des_l = (-x, 0) if x < 0 else (0, x)
+        des_h = min(self.height - 1, des_t + widget.height - src_t - 1)
+        des_w = min(self.width - 1, des_l + widget.width - src_l - 1)
 
-            widget.refresh()
-            y, x = widget.top - self.min_row, widget.left - self.min_col
-            src_t, des_t = (-y, 0) if y < 0 else (0, y)
-            src_l, des_l = (-x, 0) if x < 0 else (0, x)
-            des_h = min(h - 1, des_t + widget.height)
-            des_w = min(w - 1, des_l + widget.width - 1)
+        if des_h < des_t or des_w < des_l:
+            return None
 
-            widget.overlay(self.window, src_t, src_l, des_t, des_l, des_h, des_w)
+        return src_t, src_l, des_t, des_l, des_h, des_w
@@ -1,5 +1,3 @@
-import curses
-
 import numpy as np
 
 from .widget import Widget, BORDER_STYLES
@@ -15,14 +13,43 @@ class ArrayWin(Widget):
         The border type; one of `nurses.widget.BORDER_STYLES`. (by default a widget has no border)
     border_color: optional
         A curses color_pair.  If a border is given, border_color will be the color of the border. (the default is `color`)
+    char_dtype: optional
+        The dtype of `buffer`. One of `"U1"` (one character strings), `np.uint32` (code points) or `np.uint8`
+        (code points of latin-1 characters only, so no borders). (the default is `"U1"`)
+    color_dtype: optional
+        The dtype of `colors`.  Colors are stored as curses attributes (a color pair's index shifted left 8 bits, as
+        returned by `curses.color_pair`), not pair indices, so they fit in `np.uint16` but pairs from 128 on overflow
+        `np.int16`. (the default is `int`)
+    packed: optional
+        If true, characters and colors are stored interleaved in a single structured array and `_buffer` and `_colors`
+        are views of its fields.  Whole-array copies are slower on the strided fields. (the default is `False`)
+    mask: optional
+        If `transparent`, a boolean array the shape of the widget that is true where the widget is drawn; the rest is
+        see-through. (by default blanks are see-through)
+    transparent_character: optional
+        If `transparent` and there's no `mask`, cells holding this character are see-through. (the default is " ")
 
     Notes
     -----
     __getitem__ and __setitem__ call the respective buffer functions directly, so one can slice
-    and write to a Widget as if it was a numpy array.
+    and write to a Widget as if it was a numpy array.  They take and return strings whatever the `char_dtype`, but
+    `buffer` holds code points if `char_dtype` isn't `"U1"`.
+
+    Compact dtypes shrink a cell from 12 bytes (`"U1"` and `int`) to 6 bytes (`np.uint32` and `np.uint16`) or 3 bytes
+    (`np.uint8` and `np.uint16`).  Widgets that compare their buffers to strings directly, such as :class: TextPad,
+    need `"U1"`.
+
+    Writes through `__setitem__`, and setting `buffer`, `colors` or `mask`, mark the widget dirty.  Writes through the
+    arrays returned by `buffer`, `colors` or `mask` (e.g., `widget.colors[0] = color`), or to `_buffer` or `_colors`,
+    should be followed by `request_redraw`.
     """
 
     default_character = " "
+    char_dtype = "U1"
+    color_dtype = int
+    packed = False
+    transparent_character = " "
+    _mask = None
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -36,9 +63,7 @@ class ArrayWin(Widget):
         super().update_geometry()
 
         if self._buffer is None:
-            h, w = self.height, self.width
-            self._buffer = np.full((h, w), self.default_character)
-            self._colors = np.full((h, w), self.color)
+            self._buffer, self._colors = self._new_cells(self.height, self.width)
 
             if self.has_border:
                 self.border(self.border_style, self.border_color)
@@ -49,10 +74,11 @@ class ArrayWin(Widget):
 
     @colors.setter
     def colors(self, array):
+        self.request_redraw()
         if self.has_border:
             self._colors[1: -1, 1: -1] = array
         else:
-            self._colors = array
+            self._colors[:] = array
 
     @property
     def buffer(self):
@@ -60,28 +86,83 @@ class ArrayWin(Widget):
 
     @buffer.setter
     def buffer(self, array):
+        self.request_redraw()
         if self.has_border:
-            self._buffer[1: -1, 1: -1] = array
+            self._buffer[1: -1, 1: -1] = self._encode(array)
+        else:
+            self._buffer[:] = self._encode(array)
+
+    @property
+    def mask(self):
+        return self._mask
+
+    @mask.setter
+    def mask(self, array):
+        self.request_redraw()
+        self._mask = None if array is None else np.asarray(array, dtype=bool)
+
+    def _new_cells(self, height, width):
+        """Return new buffer and colors arrays filled with `default_character` and `color`.
+        """
+        char = self._encode(self.default_character)
+
+        if self.packed:
+            cells = np.empty((height, width), dtype=[("char", self.char_dtype), ("color", self.color_dtype)])
+            cells["char"] = char
+            cells["color"] = self.color
+            return cells["char"], cells["color"]
+
+        return np.full((height, width), char, dtype=self.char_dtype), np.full((height, width), self.color, dtype=self.color_dtype)
+
+    def _encode(self, text):
+        """Convert a character or an array of characters to `char_dtype`.
+        """
+        if np.dtype(self.char_dtype).kind == "U":
+            return text
+
+        if isinstance(text, str):
+            codes = ord(text)
+        elif (text := np.asarray(text)).dtype.kind == "U":
+            codes = np.ascontiguousarray(text, dtype="U1").view(np.uint32)
         else:
-            self._buffer = array
+            return text  # Already code points
+
+        if np.dtype(self.char_dtype).itemsize == 1 and np.max(codes, initial=0) > 255:
+            raise ValueError("np.uint8 buffers can only hold latin-1 characters")
+
+        return codes
+
+    def _decode(self, codes):
+        """Convert a code point or an array of code points in `char_dtype` to strings.
+        """
+        if np.dtype(self.char_dtype).kind == "U":
+            return codes
+
+        if isinstance(codes, np.ndarray):
+            return codes.astype(np.uint32, copy=False).view("U1")
+
+        return chr(codes)
 
     def _resize(self):
         if self.window is None:
             return
 
         if self.has_border:
-            self._buffer[:, -1] = self._buffer[-1] = self.default_character  # Erase the right-most/bottom-most border in case widget expands
+            self._buffer[:, -1] = self._buffer[-1] = self._encode(self.default_character)  # Erase the right-most/bottom-most border in case widget expands
 
         height, width = self.height, self.width
         old_h, old_w = self._buffer.shape
         min_h, min_w = min(height, old_h), min(width, old_w)
 
-        new_buffer = np.full((height, width), self.default_character)
+        new_buffer, new_colors = self._new_cells(height, width)
         new_buffer[:min_h, :min_w] = self._buffer[:min_h, :min_w]
-
-        new_colors = np.full((height, width), self.color)
         new_colors[:min_h, :min_w] = self._colors[:min_h, :min_w]
 
+        if self._mask is not None:
+            new_mask = np.ones((height, width), dtype=bool)
+            new_mask[:min_h, :min_w] = self._mask[:min_h, :min_w]
+            self._mask = new_mask
+
         self._buffer = new_buffer
         self._colors = new_colors
 
@@ -93,16 +174,12 @@ class ArrayWin(Widget):
     def push(self):
         """Write the buffers to the window.
         """
-        it = np.nditer((self._buffer, self._colors), ["multi_index"])
-        for char, color in it:
-
-            # Newline character on the last corner of a window will advance the cursor out-of-bounds causing an error
-            # TODO: Implement a more perfomant solution, either check the index, catch the error, or add an extra row to the windows
-            if (ch := str(char)) == "\n":
-                ch = " "
+        window = self.window
+        window.chars[:] = self._decode(self._buffer)
+        window.colors[:] = self._colors
 
-            y, x = it.multi_index
-            self.window.addstr(y, x, ch, color)
+        window.mask = self._mask
+        window.transparent_character = self.transparent_character
 
     def refresh(self):
         self.push()
@@ -111,9 +188,9 @@ class ArrayWin(Widget):
     def __getitem__(self, key):
         """
         `buffer.__getitem__` except offset if `self.has_border` is true
-        (i.e., `buffer[1: -1, 1: -1].__getitem__` if `self.has_border`).
+        (i.e., `buffer[1: -1, 1: -1].__getitem__` if `self.has_border`).  Code points are converted to strings.
         """
-        return self.buffer[key]
+        return self._decode(self.buffer[key])
 
     def __setitem__(self, key, text):
         """
@@ -136,11 +213,15 @@ class ArrayWin(Widget):
         elif len(text) > 1:
             text = np.array(tuple(text))
 
+        text = self._encode(text)
+
         try:
             self.buffer[key] = text
         except ValueError:
             self.buffer[key] = np.rot90(text if len(text.shape) == 2 else text[None, ], -1)  # Try to fit the text vertically
 
+        self.request_redraw()
+
     def border(self, style="light", color=None):
         """
         Draw a border on the edges of the widget.
@@ -165,7 +246,7 @@ class ArrayWin(Widget):
         self.border_style = style
         self.border_color = color
 
-        ul, ur, v, h, ll, lr = BORDER_STYLES[style]
+        ul, ur, v, h, ll, lr = map(self._encode, BORDER_STYLES[style])
 
         b = self._buffer
         b[(0, -1), :] = h
@@ -178,6 +259,8 @@ class ArrayWin(Widget):
         c = self._colors
         c[0] = c[-1] = c[:, 0] = c[:, -1] = color or self.color
 
+        self.request_redraw()
+
     def roll(self, shift=1, vertical=False):
         """
         Roll the contents of the widget. Items that roll beyond the last position are re-introduced at the first.
@@ -205,5 +288,5 @@ class ArrayWin(Widget):
         """
         self.roll(lines, vertical=True)
         slice_ = slice(-lines, None) if lines > 0 else slice(None, -lines)
-        self.buffer[slice_] = self.default_character
+        self.buffer[slice_] = self._encode(self.default_character)
         self.colors[slice_] = self.color
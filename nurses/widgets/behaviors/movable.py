@@ -1,7 +1,9 @@
-from ... import UP, DOWN, LEFT, RIGHT, UP_2, DOWN_2, LEFT_2, RIGHT_2
+from ... import UP, DOWN, LEFT, RIGHT, UP_2, DOWN_2, LEFT_2, RIGHT_2, KeyRepeat
 
 
 class Movable:
+    """Move the widget with the arrow keys.  A :class: KeyRepeat moves it all its steps at once.
+    """
     move_up = UP
     move_up_alt = UP_2
     move_down = DOWN
@@ -22,20 +24,16 @@ class Movable:
     def on_press(self, key):
         top, left = self.top, self.left
         height, width = self.height, self.width
-        bounded = self.bounded
+        count = key.count if isinstance(key, KeyRepeat) else 1
 
         if key == self.move_up or key == self.move_up_alt:
-            if not bounded or top > 0:
-                self.top -= self.ud_step
+            self.top -= self._steps(top, self.ud_step, count) * self.ud_step
         elif key == self.move_down or key == self.move_down_alt:
-            if not bounded or top + height < self.parent.height:
-                self.top += self.ud_step
+            self.top += self._steps(self.parent.height - top - height, self.ud_step, count) * self.ud_step
         elif key == self.move_left or key == self.move_left_alt:
-            if not bounded or left > 0:
-                self.left -= self.lr_step
+            self.left -= self._steps(left, self.lr_step, count) * self.lr_step
         elif key == self.move_right or key == self.move_right_alt:
-            if not bounded or left + width < self.parent.width:
-                self.left += self.lr_step
+            self.left += self._steps(self.parent.width - left - width, self.lr_step, count) * self.lr_step
         else:
             return super().on_press(key)
 
@@ -43,4 +41,14 @@ class Movable:
             self.top %= self.wrap_height
         if self.wrap_width:
             self.left %= self.wrap_width
-        return True
\ No newline at end of file
+        if count > 1:
+            key.consume()
+        return True
+
+    def _steps(self, room, step, count):
+        """Number of the `count` steps that can be taken; if bounded, steps are taken while there's room left.
+        """
+        if not self.bounded:
+            return count
+
+        return min(count, max(0, -(-room // step)))
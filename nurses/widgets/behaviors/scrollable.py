@@ -1,8 +1,10 @@
-from ... import UP, DOWN, LEFT, RIGHT, UP_2, DOWN_2, LEFT_2, RIGHT_2, PGUP, PGDN
+from ... import UP, DOWN, LEFT, RIGHT, UP_2, DOWN_2, LEFT_2, RIGHT_2, PGUP, PGDN, KeyRepeat
 
 
 class Scrollable:
     """Warning:: Scrollable behavior for :class: ArrayPad only.
+
+    A :class: KeyRepeat scrolls all its steps at once.
     """
     scroll_up = UP
     scroll_up_alt = UP_2
@@ -21,20 +23,23 @@ class Scrollable:
         page = self.buffer.shape[0] - 1 - height_offset
         min_row, min_col = self.min_row, self.min_col
         max_min_row = self.rows - (self.height - height_offset - border_width)
+        count = key.count if isinstance(key, KeyRepeat) else 1
 
         if key == self.scroll_up or key == self.scroll_up_alt:
-            self.min_row = max(0, min_row - 1)
+            self.min_row = max(0, min_row - count)
         elif key == self.scroll_down or key == self.scroll_down_alt:
-            self.min_row = min(max_min_row, min_row + 1)
+            self.min_row = min(max_min_row, min_row + count)
         elif key == self.scroll_left or key == self.scroll_left_alt:
-            self.min_col = max(0, min_col - 1)
+            self.min_col = max(0, min_col - count)
         elif key == self.scroll_right or key == self.scroll_right_alt:
-            self.min_col = min(self.cols - (self.width - self.left_scrollbar - self.right_scrollbar - border_width), min_col + 1)
+            self.min_col = min(self.cols - (self.width - self.left_scrollbar - self.right_scrollbar - border_width), min_col + count)
         elif key == PGUP:
-            self.min_row = max(0, min_row - page)
+            self.min_row = max(0, min_row - page * count)
         elif key == PGDN:
-            self.min_row = min(max_min_row, min_row + page)
+            self.min_row = min(max_min_row, min_row + page * count)
         else:
             return super().on_press(key)
 
+        if count > 1:
+            key.consume()
         return True
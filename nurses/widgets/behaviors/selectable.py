@@ -1,32 +1,28 @@
-from collections import deque
-from weakref import ref
-
 from ... import TAB
 
-selectables = deque()
-
 
 class Selectable:
-    __selected = None
+    """
+    Pressing `select_key` focuses the next Selectable widget (see :class: FocusManager) and pulls it to the front.
 
+    While a Selectable is selected (focused), keys go to it (and its children) first.  Until one is selected, keys are
+    broadcast and Selectables that aren't selected stop them.  Selectables join the focus chain when they're added to the
+    widget tree.
+    """
     select_key = TAB
 
-    def __init__(self, *args, **kwargs):
-        selectables.append(ref(self))
-        super().__init__(*args, **kwargs)
+    def on_attach(self, root):
+        root.focus.add_to_chain(self)  # Joins the focus chain once it's in a tree.
+        return super().on_attach(root)
 
     @property
     def is_selected(self):
-        return Selectable.__selected is self
+        return self.root is not None and self.root.focus.focused is self
 
     def on_press(self, key):
         if key == self.select_key:
-            while selectables[0]() is None:
-                selectables.popleft()
-            Selectable.__selected = selectables[0]()
-            selectables.rotate(-1)
-
-            Selectable.__selected.parent.pull_to_front(Selectable.__selected)
+            if (selected := self.root.focus.focus_next()) is not None:
+                selected.parent.pull_to_front(selected)
             return True
         elif self.is_selected:
             return super().on_press(key)
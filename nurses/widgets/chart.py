@@ -38,6 +38,7 @@ class Chart(ArrayWin):
 
     def update(self, value):
         self.values.append(value)
+        self.request_redraw()
 
     def refresh(self):
         n_labels = self.y_label
@@ -46,7 +47,7 @@ class Chart(ArrayWin):
 
         it = reversed(self.values)
         values = tuple(next(it) for _ in range(w - y_label_width))
-        max_v = max(values)
+        max_v = max(values) or 1  # All zeros (e.g., no values yet) would divide by zero.
 
         gradient = self.gradient
 
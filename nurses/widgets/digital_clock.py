@@ -99,3 +99,5 @@ class DigitalClock(Widget):
         for x, digit in enumerate(digital_time(self.twelve_hour)):
             for y, line in enumerate(digit):
                 self.window.addstr(y, x * 3, line)
+
+        self.is_dirty = True  # The time is always changing; redraw every frame.
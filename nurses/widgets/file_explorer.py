@@ -5,6 +5,14 @@ from .. import UP, UP_2, DOWN, DOWN_2, ENTER, PGUP, PGDN, CENTER
 
 
 class FileExplorer(ArrayPad):
+    """
+    Browse directories and select a file (selected file is stored in `file`).
+
+    Notes
+    -----
+    Directories are listed in a worker thread (see :class: Scheduler's `run_in_thread`) so a slow file system doesn't
+    block input and drawing; the explorer shows an empty listing until the listing is done.
+    """
     move_up = UP
     move_up_alt = UP_2
     move_down = DOWN
@@ -21,17 +29,16 @@ class FileExplorer(ArrayPad):
 
         if isinstance(self.default_directory, str):
             self.default_directory = Path(self.default_directory)
+        self._current_path = self.default_directory
 
     def open_explorer(self):
         self.is_open = True
         self.file = None
-        self.current_directory = self._get_directory()
-        self.selection = 1
-        self.min_row = 0
 
         if self.root is not None:
             self.root.add_widget(self)
-            self.root.refresh()
+
+        self._change_directory(self._current_path)
 
     def close_explorer(self):
         self.is_open = False
@@ -39,7 +46,7 @@ class FileExplorer(ArrayPad):
 
         if self.root is not None:
             self.root.remove_widget(self)
-            self.root.refresh()
+            self.request_redraw()
 
     def update_geometry(self):
         if self.root is None:
@@ -60,7 +67,7 @@ class FileExplorer(ArrayPad):
         if (need_rows := len(directory) + 1 - self.rows) > 0:
             self.rows += need_rows
 
-        if (need_cols := max(len(str(path)) for path in directory) - self.cols) > 0:
+        if (need_cols := max((len(str(path)) for path in directory), default=0) - self.cols) > 0:
             self.cols += need_cols
 
         self[1:] = " "
@@ -72,10 +79,10 @@ class FileExplorer(ArrayPad):
 
         super().refresh()
 
-    def _get_directory(self):
+    def _get_directory(self, path):
         directories = []
         files = []
-        for child in self._current_path.iterdir():
+        for child in path.iterdir():
             if child.name.startswith("."):  # Skip hidden files / folders
                 continue
 
@@ -89,17 +96,36 @@ class FileExplorer(ArrayPad):
 
         return directories + files
 
+    def _change_directory(self, path):
+        """Show an empty listing of `path` and schedule listing it.
+        """
+        self._current_path = path
+        self.current_directory = [ ]
+        self.selection = 0
+        self.min_row = 0
+        self.request_redraw()
+
+        from .. import ScreenManager  # We need the event loop, but we need to defer this import to avoid a circular import.
+        ScreenManager().run_soon(self._list_directory(path))
+
+    async def _list_directory(self, path):
+        from .. import ScreenManager
+        directory = await ScreenManager().run_in_thread(self._get_directory, path)
+
+        if self.is_open and path == self._current_path:  # Otherwise, the explorer moved on while we were listing.
+            self.current_directory = directory
+            self.selection = 1 if directory else 0
+            self.request_redraw()
+
     def on_press(self, key):
         selection = self.selection
         directory = self.current_directory
-        selected_path = directory[selection - 1]
 
         if key == self.select_key:
-            if selection == 0 or selected_path.is_dir():
-                self._current_path = self._current_path.parent if selection == 0 else selected_path
-                self.current_directory = self._get_directory()
-                self.selection = 1
-                self.min_row = 0
+            if selection == 0:
+                self._change_directory(self._current_path.parent)
+            elif (selected_path := directory[selection - 1]).is_dir():
+                self._change_directory(selected_path)
             else:
                 self.file = selected_path
                 self.close_explorer()
@@ -117,15 +143,15 @@ class FileExplorer(ArrayPad):
         else:
             return super().on_press(key)
 
-        self.root.refresh()
+        self.request_redraw()
         return True
 
 
 class DirExplorer(FileExplorer):
     dir_select = CENTER
 
-    def _get_directory(self):
-        directories = [child for child in self._current_path.iterdir() if not child.name.startswith(".") and child.is_dir()]
+    def _get_directory(self, path):
+        directories = [child for child in path.iterdir() if not child.name.startswith(".") and child.is_dir()]
         directories.sort(key=lambda path: path.name)
         return directories
 
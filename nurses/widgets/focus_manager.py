@@ -0,0 +1,138 @@
+from weakref import ref, WeakKeyDictionary
+
+
+class FocusManager:
+    """
+    Routes key presses to the focused widget.  Created by :class: Root as `root.focus`.
+
+    A key press goes to, in order:
+        1. global hotkeys for the key (opt-in, see `add_hotkey`),
+        2. the focused widget: its key bindings (see `bind`), its `on_press` and then its children (as `Widget.dispatch`
+           does),
+        3. the focused widget's ancestors: their key bindings and `on_press`, up to the root.
+
+    Only the focused widget's branch of the tree is visited, so dispatch doesn't slow down as the tree grows.
+
+    Notes
+    -----
+    If no widget is focused, keys are broadcast from the root (every widget, front to back, until one handles the key)
+    as they were before focus existed.
+
+    The focus chain is the order `focus_next` and `focus_previous` cycle through; widgets join it with `add_to_chain`.
+    Widgets in the chain are weakly referenced; dead or detached widgets are skipped.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.focused = None
+        self.chain = [ ]  # weak references to widgets, in focus order
+        self.hotkeys = { }  # key -> handlers
+        self.bindings = { }  # key -> {widget: handler}
+
+    def set_focus(self, widget):
+        """Focus `widget` (or nothing, if `widget` is None).
+        """
+        if widget is self.focused:
+            return
+
+        for old_or_new in (self.focused, widget):
+            if old_or_new is not None:
+                old_or_new.request_redraw()  # Widgets may be drawn differently when focused.
+
+        self.focused = widget
+
+    def add_to_chain(self, widget):
+        """Add `widget` to the end of the focus chain, if it isn't in it already.
+        """
+        if all(widget_ref() is not widget for widget_ref in self.chain):
+            self.chain.append(ref(widget))
+
+    def remove_from_chain(self, widget):
+        self.chain = [widget_ref for widget_ref in self.chain if widget_ref() not in (widget, None)]
+
+    def focus_next(self, step=1):
+        """
+        Focus the next widget in the focus chain (wrapping around) and return it, or None if the chain is empty.  If no
+        widget in the chain is focused, the first widget (or last, if `step` is negative) is focused.
+        """
+        self.chain = chain = [widget_ref for widget_ref in self.chain if widget_ref() is not None]
+        widgets = [widget for widget_ref in chain if (widget := widget_ref()).root is self.root]
+        if not widgets:
+            return None
+
+        if self.focused in widgets:
+            index = (widgets.index(self.focused) + step) % len(widgets)
+        else:
+            index = 0 if step > 0 else -1
+
+        self.set_focus(widgets[index])
+        return self.focused
+
+    def focus_previous(self):
+        return self.focus_next(-1)
+
+    def discard(self, widget):
+        """Called when `widget` is removed from the tree: if the focused widget was in its branch, nothing is focused.
+        """
+        focused = self.focused
+        while focused is not None:
+            if focused is widget:
+                self.focused = None
+                return
+            focused = focused.parent
+
+    def add_hotkey(self, key, handler):
+        """
+        Call `handler()` whenever `key` is pressed, whichever widget is focused.  Hotkeys are checked before any widget
+        and handle the key.
+        """
+        self.hotkeys.setdefault(key, [ ]).append(handler)
+
+    def remove_hotkey(self, key, handler):
+        handlers = self.hotkeys[key]
+        handlers.remove(handler)
+        if not handlers:
+            del self.hotkeys[key]
+
+    def bind(self, widget, key, handler):
+        """
+        Call `handler()` when `key` is pressed while `widget` is focused or is an ancestor of the focused widget.  A
+        binding handles the key before the widget's `on_press` is tried.
+        """
+        if (bindings := self.bindings.get(key)) is None:
+            self.bindings[key] = bindings = WeakKeyDictionary()
+
+        bindings[widget] = handler
+
+    def unbind(self, widget, key):
+        del self.bindings[key][widget]
+
+    def dispatch(self, key):
+        """Send `key` to the hotkeys, the focused widget and its ancestors, until it's handled.  Returns whether it was.
+        """
+        if handlers := self.hotkeys.get(key):
+            for handler in handlers:
+                handler()
+            return True
+
+        widget = self.focused
+        if widget is None:
+            return bool(self.root.dispatch(key))
+
+        bindings = self.bindings.get(key)
+
+        if bindings and (handler := bindings.get(widget)) is not None:
+            handler()
+            return True
+
+        if widget.on_press(key) or widget.dispatch(key):
+            return True
+
+        while (widget := widget.parent) is not None:
+            if bindings and (handler := bindings.get(widget)) is not None:
+                handler()
+                return True
+
+            if widget.on_press(key):
+                return True
+
+        return False
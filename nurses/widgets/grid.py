@@ -24,6 +24,8 @@ class Grid(Layout):
 
         widget.parent = self
         widget.update_geometry()
+        self._spatial_index = None  # Placeholders were replaced; it's rebuilt when needed.
+        self._attach(widget)
 
     def update_geometry(self):
         if self.root is None:
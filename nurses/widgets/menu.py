@@ -1,7 +1,6 @@
-import curses
-
 from . import Widget
 from .. import UP, DOWN, UP_2, DOWN_2, ENTER
+from ..window import Window
 
 
 class Menu(Widget):
@@ -71,7 +70,7 @@ class Menu(Widget):
             self.selected_color = colors.BLACK_ON_WHITE
 
         if self.window is None:
-            self.window = curses.newwin(self.height, self.width + 1)
+            self.window = Window(self.height, self.width)
             self.update_color(self.color)
             self.window.addstr(0, 0, self.name)
 
@@ -85,18 +84,18 @@ class Menu(Widget):
                 menu.window.addstr(i + offset, offset, item)
 
     def refresh(self):
-        if self.is_closed:
-            return
+        if self.is_open:
+            menu = self._menu_widget
+            offset = int(menu.has_border)
+            for i, item in enumerate(self.items):
+                self._menu_widget.window.chgat(i + offset, offset, menu.width - 2 * offset, self.color if i != self._selected_entry else self.selected_color)
 
-        menu = self._menu_widget
-        offset = int(menu.has_border)
-        for i, item in enumerate(self.items):
-            self._menu_widget.window.chgat(i + offset, offset, menu.width - 2 * offset, self.color if i != self._selected_entry else self.selected_color)
+        super().refresh()
 
     def on_press(self, key):
         if key == self.open_close_key:
             self.open_menu() if self.is_closed else self.close_menu()
-            self.root.refresh()
+            self.request_redraw()
             return True
 
         if self.is_closed:
@@ -115,5 +114,5 @@ class Menu(Widget):
         else:
             return
 
-        self.root.refresh()
+        self.request_redraw()
         return True
@@ -53,13 +53,14 @@ class Menubar(Widget):
                 self.is_activated = True
                 self.active_menu = 0
 
-            self.root.refresh()
+            self.request_redraw()
             return True
 
         if not self.is_activated:
             return
 
         if menus[active].is_open and menus[active].on_press(key):
+            self.request_redraw()  # Menus are drawn by the menubar's refresh.
             return True
 
         if key == self.move_left or key == self.move_left_alt:
@@ -87,7 +88,7 @@ class Menubar(Widget):
         else:
             return
 
-        self.root.refresh()
+        self.request_redraw()
         return True
 
     def update_geometry(self):
@@ -1,18 +1,28 @@
 from collections import defaultdict
 
+from .focus_manager import FocusManager
 from .widget import Widget
+from ..window import Window
 
 
 class Root(Widget):
-    """Only meant to be instantiated by the ScreenManager.
+    """
+    Only meant to be instantiated by the ScreenManager.
+
+    Each widget draws on its own window and is composited into its parent's window, so the tree is composited
+    bottom-up, one window per widget, until it reaches the root's screen-sized window, which the backend presents.
+
+    Key presses are routed by `focus`, a :class: FocusManager.
     """
     height = None  # We don't want Widget's height, width properties
     width = None
 
-    def __init__(self, screen):
+    def __init__(self, backend):
         self.children = [ ]
         self.group = defaultdict(list)
-        self.window = screen
+        self.backend = backend
+        self.window = None
+        self.focus = FocusManager(self)
 
         self.top, self.left = 0, 0
         self.update_geometry()
@@ -26,16 +36,40 @@ class Root(Widget):
         """
         # TODO: If terminal isn't automatically resized on linux, fallback to `curses.resizeterm(h, w)`
         #  ...: Windows curses automatically calls a resize on a resize event...
-        h, w = self.window.getmaxyx()
+        h, w = self.backend.getmaxyx()
         self.height = h
-        self.width = w - 1
+        self.width = w - 1  # Writing to the last column of the last row would advance the cursor off-screen.
+
+        if self.window is None:
+            self.window = Window(self.height, self.width)
+        else:
+            self.window.resize(self.height, self.width)
+
+        self.backend.invalidate()
 
         for child in self.children:
             child.update_geometry()
 
+        for widget in self.walk():  # Hints and getters may have moved anything; redraw and re-index everything.
+            widget.is_dirty = True
+            widget._spatial_index = None
+
+    def request_redraw(self):
+        """Mark the root dirty and ask the ScreenManager to redraw the screen on the next frame.
+        """
+        if self.is_dirty:  # A redraw is already pending (or we're in the middle of one).
+            return
+
+        self.is_dirty = True
+
+        from .. import ScreenManager  # Deferred import to avoid a circular import.
+        ScreenManager().request_redraw()
+
     def refresh(self):
-        """Redraw children's windows.
+        """Composite the widget tree and present it.
         """
+        self.is_dirty = True  # Widgets changed while drawing this frame don't need another one.
         self.window.erase()
         super().refresh()
-        self.window.refresh()
+        self.backend.present(self.window)
+        self.is_dirty = False
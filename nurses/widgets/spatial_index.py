@@ -0,0 +1,111 @@
+CELL_SIZE = 8  # Rows and columns covered by each cell of the grid
+
+
+class SpatialIndex:
+    """
+    A uniform grid over a widget's children for hit testing: each cell of the grid holds the children that overlap it,
+    so finding the topmost child at a point only tests the children in one cell.
+
+    Parameters
+    ----------
+    children:
+        The widget's children, in drawing order (the last is topmost).  `None` placeholders are skipped.
+
+    Notes
+    -----
+    Rectangles are copied into the index, so sizes or positions given by getters (see `Widget.getter`) are only re-read
+    when the index is rebuilt (e.g., on a resize).
+
+    A widget keeps its index up-to-date as its children move, resize, are added or removed, or change drawing order
+    (see `Widget.widget_at`).  Children are ordered with stamps rather than list positions so reordering one is O(1).
+    """
+    __slots__ = "cells", "rects", "order", "n_children", "_top", "_bottom"
+
+    def __init__(self, children):
+        self.cells = { }  # (row, column) of a cell -> children overlapping it
+        self.rects = { }  # child -> (top, left, bottom, right) (bottom and right exclusive), or None if it has no size
+        self.order = { }  # child -> stamp; higher stamps are drawn later
+        self.n_children = len(children)  # Length of the children list the index was built for
+        self._top = self._bottom = 0
+
+        for child in children:
+            if child is not None:
+                self._top += 1
+                self.order[child] = self._top
+                self._add(child)
+
+    def __len__(self):
+        return len(self.order)
+
+    def _add(self, widget):
+        top, left, height, width = widget.top, widget.left, widget.height, widget.width
+        if not height or not width or height < 0 or width < 0:  # Unsized widgets can't be hit.
+            self.rects[widget] = None
+            return
+
+        bottom, right = top + height, left + width
+        self.rects[widget] = top, left, bottom, right
+
+        cells = self.cells
+        for y in range(top // CELL_SIZE, (bottom - 1) // CELL_SIZE + 1):
+            for x in range(left // CELL_SIZE, (right - 1) // CELL_SIZE + 1):
+                if (cell := cells.get((y, x))) is None:
+                    cells[y, x] = cell = { }
+                cell[widget] = None
+
+    def _discard(self, widget):
+        if (rect := self.rects.pop(widget)) is None:
+            return
+
+        cells = self.cells
+        top, left, bottom, right = rect
+        for y in range(top // CELL_SIZE, (bottom - 1) // CELL_SIZE + 1):
+            for x in range(left // CELL_SIZE, (right - 1) // CELL_SIZE + 1):
+                cell = cells[y, x]
+                del cell[widget]
+                if not cell:
+                    del cells[y, x]
+
+    def insert(self, widget):
+        """Add a child on top of the others.
+        """
+        self.n_children += 1
+        self._top += 1
+        self.order[widget] = self._top
+        self._add(widget)
+
+    def remove(self, widget):
+        self.n_children -= 1
+        if widget in self.order:
+            del self.order[widget]
+            self._discard(widget)
+
+    def move(self, widget):
+        """Update the rectangle of a child that moved or was resized.
+        """
+        self._discard(widget)
+        self._add(widget)
+
+    def raise_(self, widget):
+        self._top += 1
+        self.order[widget] = self._top
+
+    def lower(self, widget):
+        self._bottom -= 1
+        self.order[widget] = self._bottom
+
+    def hit(self, y, x):
+        """The topmost child containing `(y, x)` or None.
+        """
+        if (cell := self.cells.get((y // CELL_SIZE, x // CELL_SIZE))) is None:
+            return None
+
+        rects = self.rects
+        order = self.order
+        hit = None
+        for widget in cell:
+            top, left, bottom, right = rects[widget]
+            if top <= y < bottom and left <= x < right and (hit is None or order[widget] > order[hit]):
+                hit = widget
+
+        return hit
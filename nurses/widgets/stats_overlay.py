@@ -0,0 +1,106 @@
+from . import Widget
+from .. import F12
+
+WIDTH = 56
+
+
+class StatsOverlay(Widget):
+    """
+    Shows the ScreenManager's instrumentation (see :class: SchedulerStats): loop lag, queue depths, time spent refreshing
+    the root and the tasks with the most run time.  Pressing `toggle` shows or hides it, whichever widget is focused: it's
+    registered as a hotkey (see `FocusManager.add_hotkey`) while the overlay is in the widget tree.
+
+    Stats are only collected while the overlay is shown; hidden, it's blank and transparent.  While shown, it's redrawn
+    every `interval` seconds by a scheduled callback, which (like any scheduled task) keeps the event loop running.
+
+    Parameters
+    ----------
+    show: optional
+        Show the overlay immediately. (the default is False)
+
+    Other Parameters
+    ----------------
+    toggle: optional
+        Key that shows or hides the overlay. (the default is F12)
+
+    interval: optional
+        Seconds between updates. (the default is .5)
+
+    n_tasks: optional
+        Number of tasks listed. (the default is 5)
+
+    Notes
+    -----
+    Add the overlay last (or `pull_to_front` it) so that it's drawn over other widgets.
+    """
+    toggle = F12
+    interval = .5
+    n_tasks = 5
+
+    def __init__(self, top=0, left=0, *args, show=False, **kwargs):
+        n_tasks = kwargs.get("n_tasks", self.n_tasks)
+        border = 2 * bool(kwargs.get("border_style"))
+        super().__init__(top, left, 4 + n_tasks + border, WIDTH + border, *args, **kwargs)
+
+        self.is_shown = False
+        self._transparent = self.transparent
+        self._callback = None
+        self.transparent = True
+
+        if show:
+            self.show()
+
+    def show(self):
+        if self.is_shown:
+            return
+
+        from .. import ScreenManager  # We need the event loop, but we need to defer this import to avoid a circular import.
+        sm = ScreenManager()
+
+        sm.enable_stats().reset()
+        self._callback = sm.schedule(self.request_redraw, delay=self.interval)
+
+        self.is_shown = True
+        self.transparent = self._transparent
+        self.request_redraw()
+
+    def hide(self):
+        if not self.is_shown:
+            return
+
+        from .. import ScreenManager
+        ScreenManager().disable_stats()
+
+        self._callback.cancel()
+        self._callback = None
+
+        self.is_shown = False
+        self.transparent = True
+        self.request_redraw()
+
+    def refresh(self):
+        self.window.erase()
+
+        if self.is_shown:
+            from .. import ScreenManager
+
+            if (stats := ScreenManager().stats) is not None:
+                offset = int(self.has_border)
+                for y, line in enumerate(stats.summary(self.n_tasks)):
+                    self.window.addstr(offset + y, offset, line[:self.width - 2 * offset])
+
+            if self.has_border:
+                self.border(self.border_style, self.border_color)
+
+        super().refresh()
+
+    def toggle_shown(self):
+        self.hide() if self.is_shown else self.show()
+
+    def on_attach(self, root):
+        root.focus.add_hotkey(self.toggle, self.toggle_shown)
+        return super().on_attach(root)
+
+    def on_detach(self, root):
+        root.focus.remove_hotkey(self.toggle, self.toggle_shown)
+        return super().on_detach(root)
@@ -24,6 +24,7 @@ from .. import (
     DELETE,
     SUP,
     SDOWN,
+    Paste,
 )
 
 KEYS = {
@@ -78,6 +79,7 @@ class TextPad(ArrayPad):
 
         self._set_min_row(i)
         self._set_min_col(len(line))
+        self.request_redraw()
 
     @property
     def has_selection(self):
@@ -243,7 +245,59 @@ class TextPad(ArrayPad):
 
         colors[self.pad == self.default_character] = self.color
 
+    def insert_text(self, text):
+        """
+        Insert `text` at the cursor, replacing the selection if there is one, and move the cursor to the end of it.  The
+        pad is resized once and the rows below are moved once, however many lines `text` has.
+        """
+        self.delete_selection()
+        self._last_x = None
+
+        default = self.default_character
+        curs_y, curs_x = self._absolute_cursor
+        lines = tuple(self._lines(text.replace("\t", "    ")))
+        n_new_lines = len(lines) - 1
+
+        rest_of_line = self.pad[curs_y, curs_x: curs_x + self._line_length(curs_y, curs_x)].copy()
+
+        # The new rows: the current line up to the cursor and the first inserted line, the inserted lines between and
+        # the last inserted line followed by the rest of the current line.
+        if n_new_lines:
+            lengths = [curs_x + len(lines[0]), *map(len, lines[1:-1]), len(lines[-1]) + len(rest_of_line)]
+        else:
+            lengths = [curs_x + len(lines[0]) + len(rest_of_line)]
+
+        # Resize pad once for all the new text; keep a column free for the cursor at the end of a line.
+        if (new_rows := (self.pad == "\n").sum() + 1 + n_new_lines - self.rows) > 0:
+            self.rows += new_rows
+
+        if (new_cols := max(lengths) + 1 - self.cols) > 0:
+            self.cols += new_cols
+
+        pad = self.pad
+
+        if n_new_lines:
+            # Move lines down
+            pad[curs_y + 1 + n_new_lines:] = pad[curs_y + 1: self.rows - n_new_lines]
+            pad[curs_y + 1: curs_y + 1 + n_new_lines] = default
+
+        pad[curs_y, curs_x:] = default
+        for i, line in enumerate(lines):
+            x = curs_x if i == 0 else 0
+            pad[curs_y + i, x: x + len(line)] = tuple(line)
+
+        end_x = (0 if n_new_lines else curs_x) + len(lines[-1])
+        pad[curs_y + n_new_lines, end_x: end_x + len(rest_of_line)] = rest_of_line
+
+        self._set_min_row(curs_y + n_new_lines)
+        self._set_min_col(end_x)
+        self.request_redraw()
+
     def on_press(self, key):
+        if isinstance(key, Paste):
+            self.insert_text(key)
+            return True
+
         if key not in KEYS:
             return super().on_press(key)
 
@@ -465,7 +519,7 @@ class TextPad(ArrayPad):
 
             self._set_min_col(curs_x + 1)
 
-        self.root.refresh()
+        self.request_redraw()
         return True
 
     def refresh(self):
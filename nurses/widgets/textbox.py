@@ -1,7 +1,7 @@
 import string
 
 from . import Widget
-from .. import BACKSPACE, TAB, ENTER, LEFT, LEFT_2, RIGHT, RIGHT_2, HOME, END, DELETE
+from .. import BACKSPACE, TAB, ENTER, LEFT, LEFT_2, RIGHT, RIGHT_2, HOME, END, DELETE, Paste
 
 KEYS = { BACKSPACE, TAB, ENTER, LEFT, RIGHT, LEFT_2, RIGHT_2, HOME, END, DELETE, *map(ord, string.printable) }
 
@@ -12,6 +12,7 @@ class Textbox(Widget):
     def __init__(self, top, left, width, *args, **kwargs):
         super().__init__(top, left, 3 if kwargs.get("border_style") else 1, width + 2 * bool(kwargs.get("border_style")), *args, **kwargs)
         self._gathering = False
+        self._gather_task = None
         self._reset()
 
     def refresh(self):
@@ -31,6 +32,8 @@ class Textbox(Widget):
         else:
             self.window.chgat(offset, offset + self._cursor_x, 1, self.cursor_color)
 
+        super().refresh()
+
     def _reset(self):
         self._input = ""
         self._input_offset = 0
@@ -42,10 +45,12 @@ class Textbox(Widget):
         from .. import ScreenManager  # We need the event loop, but we need to defer this import to avoid a circular import.
         sm = ScreenManager()
 
-        self.root.refresh()
+        self.request_redraw()
 
+        self._gather_task = sm.current
         while self._gathering:
-            await sm.next_task()
+            await sm.wait_for_input()  # Woken by `on_press` when enter is pressed.
+        self._gather_task = None
 
         self.parent.remove_widget(self)
 
@@ -54,8 +59,31 @@ class Textbox(Widget):
         finally:
             self._reset()
 
+    def insert_text(self, text):
+        """Insert `text` at the cursor and move the cursor to the end of it.  Line breaks are replaced with spaces.
+        """
+        text = "".join(char for char in " ".join(text.replace("\t", "    ").splitlines()) if char.isprintable())
+        end = self.width - 2 * self.has_border - 1
+        position = self._input_offset + self._cursor_x
+
+        self._input = f"{self._input[:position]}{text}{self._input[position:]}"
+
+        position += len(text)
+        if position - self._input_offset > end:
+            self._input_offset = position - end
+        self._cursor_x = position - self._input_offset
+
+        self.request_redraw()
+
     def on_press(self, key):
-        if not self._gathering or key not in KEYS:
+        if not self._gathering:
+            return
+
+        if isinstance(key, Paste):
+            self.insert_text(key)
+            return True
+
+        if key not in KEYS:
             return
 
         text = self._input
@@ -65,6 +93,7 @@ class Textbox(Widget):
 
         if key == ENTER:
             self._gathering = False
+            self._gather_task.scheduler.wake(self._gather_task)
 
         elif key == TAB:
             self._input = f"{text[:text_offset + cursor_x]}    {text[text_offset + cursor_x:]}"
@@ -118,5 +147,5 @@ class Textbox(Widget):
             else:
                 self._cursor_x += 1
 
-        self.root.refresh()
+        self.request_redraw()
         return True
@@ -1,7 +1,8 @@
 from collections import defaultdict
-import curses
 
+from .spatial_index import SpatialIndex
 from ..observable import Observable
+from ..window import Window
 
 
 BORDER_STYLES = {
@@ -11,6 +12,10 @@ BORDER_STYLES = {
     "curved": "╭╮│─╰╯",
 }
 
+# Opaque children smaller than this (in cells) aren't tested as occluders of their siblings: they rarely cover one and
+# testing against them would cost more than culling saves.
+MIN_OCCLUDER_AREA = 64
+
 
 class BindMagic:
     """
@@ -39,7 +44,7 @@ class BindMagic:
                 prop = owner.__dict__[attr]
                 prop.__set_name__(owner, attr)
 
-            prop.bind(owner.__name__, name)
+            prop.bind(owner, name)
 
         setattr(owner, name, self.func)
 
@@ -52,7 +57,8 @@ class Observer(type):
     """
     This metaclass simply drops the `bind_to` decorator into the class dict.
     `bind_to` allows one to quickly bind functions to attributes in the class body - these attributes
-    will be turned into Observables by the decorator.
+    will be turned into Observables by the decorator.  Patching a method onto a class invalidates every Observable's
+    dispatch tables, as subclasses may have compiled the old method.
     """
     def __prepare__(name, bases):
         return { "bind_to": BindMagic }
@@ -61,10 +67,16 @@ class Observer(type):
         del methods["bind_to"]
         return super().__new__(meta, name, bases, methods)
 
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+
+        if callable(value):  # A patched method: dispatch tables of this class or its subclasses may hold the old one.
+            Observable.invalidate_all()
+
 
 class Widget(metaclass=Observer):
     """
-    The base window for nurses.  A fancy wrapper around a curses window.
+    The base window for nurses.  A fancy wrapper around a :class: Window (a numpy-backed stand-in for a curses window).
 
     Parameters
     ----------
@@ -84,10 +96,21 @@ class Widget(metaclass=Observer):
         and the width will come from the `width` arg.)
 
     transparent: optional
-        If true, widget will overlay other widgets instead of overwrite them (whitespace will be "see-through"). (the default is `False`)
+        If true, widget will overlay other widgets instead of overwrite them (whitespace will be "see-through", but see
+        :class: ArrayWin's `mask` and `transparent_character`). (the default is `False`)
 
     Notes
     -----
+    Widgets track whether they are dirty.  Changing `top`, `left`, `height`, `width` or `color`, or calling
+    `request_redraw`, marks a widget and its ancestors dirty; a parent only refreshes its dirty children and composites
+    clean ones from their last output.  `Widget.refresh` clears the flag, so overrides of `refresh` should call it; a widget
+    that is still dirty after it refreshes (e.g., a clock that draws the current time) is refreshed every frame: the root
+    requests the next frame itself while any widget stays dirty.
+
+    Mouse events are sent to the topmost widget under the pointer (see `widget_at`) and bubble up to its ancestors until
+    an `on_mouse` returns True.  Hit testing uses a :class: SpatialIndex of each widget's children, built the first time
+    a point is tested and updated as children move.
+
     Coordinates are (y, x) (both a curses and a numpy convention) with y being vertical and increasing as you move down
     and x being horizontal and increasing as you move right.  Top-left corner is (0, 0)
 
@@ -99,11 +122,13 @@ class Widget(metaclass=Observer):
 
     color = 0
     parent = None
+    is_dirty = True
     transparent = False
     border_style = None
     border_color = None
     pos_hint = None, None
     size_hint = None, None
+    _spatial_index = None  # Of children; built by `widget_at`
 
     def __init_subclass__(cls):
         Widget.types[cls.__name__] = cls  # Register subclasses
@@ -111,6 +136,9 @@ class Widget(metaclass=Observer):
         if not cls.on_press.__doc__:
             cls.on_press.__doc__ = Widget.on_press.__doc__
 
+        if not cls.on_mouse.__doc__:
+            cls.on_mouse.__doc__ = Widget.on_mouse.__doc__
+
     def __init__(self, *args, **kwargs):
         self.children = [ ]
         self.group = defaultdict(list)
@@ -146,6 +174,7 @@ class Widget(metaclass=Observer):
         observable = getattr(type(self), name, None)
         if not isinstance(observable, Observable):
             setattr(type(self), name, observable := Observable(observable))
+            observable.__set_name__(type(self), name)
 
         observable.getters[self] = getter
 
@@ -165,6 +194,16 @@ class Widget(metaclass=Observer):
     def _set_size_hint_x(self):
         self.size_hint = self.size_hint[0], None
 
+    @bind_to("top", "left")
+    def _reposition(self):
+        if self.parent is not None:
+            self.parent.request_redraw()
+
+    @bind_to("top", "left", "height", "width")
+    def _update_spatial_index(self):
+        if (parent := self.parent) is not None and (index := parent._spatial_index) is not None and self in index.order:
+            index.move(self)
+
     def update_geometry(self):
         """
         Set or reset the widget's geometry based on size or pos hints if they exist.
@@ -202,7 +241,7 @@ class Widget(metaclass=Observer):
         self.size_hint = height, width
 
         if self.window is None:
-            self.window = curses.newwin(self.height, self.width + 1)
+            self.window = Window(self.height, self.width)
             self.update_color(self.color)
 
             if self.has_border:
@@ -221,7 +260,7 @@ class Widget(metaclass=Observer):
 
         if self.has_border:  # Erase the right-most, lower-most border in case widget expands
             h, w = window.getmaxyx()
-            h, w = h - 1, w - 2
+            h, w = h - 1, w - 1
             color = self.color
             ch = self.default_character
             window.addstr(0, w, ch, color)
@@ -233,7 +272,7 @@ class Widget(metaclass=Observer):
             for y in range(1, h):
                 window.addstr(y, w, ch, color)
 
-        window.resize(self.height, self.width + 1)
+        window.resize(self.height, self.width)
         self.update_color(self.color)
 
         if self.has_border:
@@ -258,7 +297,8 @@ class Widget(metaclass=Observer):
             start = self.root
 
         for child in start.children:
-            yield from self.walk(child)
+            if child is not None:  # Skip placeholders (e.g., a :class: Grid's empty cells).
+                yield from self.walk(child)
         yield start
 
     @property
@@ -274,29 +314,63 @@ class Widget(metaclass=Observer):
         """
         widgets = self.children
         if isinstance(widget, int):
-            widgets.append(widgets.pop(widget))
+            widget = widgets.pop(widget)
         else:
             widgets.remove(widget)
-            widgets.append(widget)
+        widgets.append(widget)
+
+        if self._spatial_index is not None:
+            self._spatial_index.raise_(widget)
+
+        self.request_redraw()
 
     def push_to_back(self, widget):
         """Given a widget or an index of a widget, widget is moved to bottom of widget stack (so it is drawn first).
         """
         widgets = self.children
         if isinstance(widget, int):
-            widgets.insert(0, widgets.pop(widget))
+            widget = widgets.pop(widget)
         else:
             widgets.remove(widget)
-            widgets.insert(0, widget)
+        widgets.insert(0, widget)
+
+        if self._spatial_index is not None:
+            self._spatial_index.lower(widget)
+
+        self.request_redraw()
 
     def add_widget(self, widget):
         self.children.append(widget)
         widget.parent = self
         widget.update_geometry()
 
+        if self._spatial_index is not None:
+            self._spatial_index.insert(widget)
+
+        self._attach(widget)
+
+    def _attach(self, widget):
+        """Call `on_attach` of `widget` and its descendants if this widget is attached to the root, and request a redraw.
+        """
+        if (root := self.root) is not None:
+            for descendant in widget.walk(widget):
+                descendant.on_attach(root)
+
+        self.request_redraw()
+
     def remove_widget(self, widget):
         self.children.remove(widget)
 
+        if self._spatial_index is not None:
+            self._spatial_index.remove(widget)
+
+        if (root := self.root) is not None:
+            root.focus.discard(widget)
+            for descendant in widget.walk(widget):
+                descendant.on_detach(root)
+
+        self.request_redraw()
+
     def new_widget(self, *args, group=None, create_with=None, **kwargs):
         """
         Create a new widget and append to widget stack.  Can group widgets if providing a hashable group.
@@ -319,25 +393,73 @@ class Widget(metaclass=Observer):
     def overlay(self):
         return self.window.overlay if self.transparent else self.window.overwrite
 
-    def refresh(self):
-        """Redraw children's windows.
+    def _child_region(self, widget):
+        """
+        Return `(src_t, src_l, des_t, des_l, des_h, des_w)`: the upper-left corner of the part of `widget`'s window that
+        is visible in this widget's window and the (inclusive) corners of where it's composited, or None if `widget`
+        lies entirely outside of this widget's window.
         """
-        # Notably, we don't use curses.panels as they aren't available for windows-curses...
-        # ...upside is we don't error when moving a widget off-screen.
         border = int(self.has_border)
-        h, w = self.height, self.width
-        for widget in self.children:
-            if widget is None:
+        y, x = widget.top, widget.left
+        src_t, des_t = (-y, border) if y < 0 else (0, y + border)
+        src_l, des_l = (-x, border) if x < 0 else (0, x + border)
+        des_h = min(self.height - 1, des_t + widget.height - src_t - 1)
+        des_w = min(self.width - 1, des_l + widget.width - src_l - 1)
+
+        if des_h < des_t or des_w < des_l:
+            return None
+
+        return src_t, src_l, des_t, des_l, des_h, des_w
+
+    def _visible_children(self):
+        """
+        Return a list of `(child, region)` pairs (see `_child_region`) in drawing order, skipping children that are
+        off-screen or completely covered by a later opaque sibling.
+        """
+        visible = [ ]
+        occluders = [ ]
+        for widget in reversed(self.children):
+            if widget is None or (region := self._child_region(widget)) is None:
                 continue
 
-            widget.refresh()
-            y, x = widget.top, widget.left
-            src_t, des_t = (-y, border) if y < 0 else (0, y + border)
-            src_l, des_l = (-x, border) if x < 0 else (0, x + border)
-            des_h = min(h - 1, des_t + widget.height)
-            des_w = min(w - 1, des_l + widget.width - 1)  # -1 compensates for the extra width of widget's window
+            _, _, top, left, bottom, right = region
+            for t, l, b, r in occluders:
+                if t <= top and l <= left and bottom <= b and right <= r:
+                    break
+            else:
+                visible.append((widget, region))
 
-            widget.overlay(self.window, src_t, src_l, des_t, des_l, des_h, des_w)  # FIXME: This is causing an error on WSL terminal.
+                if not widget.transparent and (bottom - top + 1) * (right - left + 1) >= MIN_OCCLUDER_AREA:
+                    occluders.append((top, left, bottom, right))
+
+        visible.reverse()
+        return visible
+
+    def refresh(self):
+        """Redraw dirty children's windows and composite all visible children.
+        """
+        # Children are composited into this widget's window, not the screen, with array slicing; nothing is written
+        # to the terminal until the root presents its window.  Clean children are composited from their last output, and children
+        # that can't be seen aren't refreshed or composited at all.
+        is_dirty = False
+        window = self.window
+        for widget, region in self._visible_children():
+            if widget.is_dirty:
+                widget.refresh()
+                is_dirty |= widget.is_dirty  # Children that stay dirty keep their ancestors dirty.
+
+            widget.overlay(window, *region)
+
+        self.is_dirty = is_dirty
+
+    @bind_to("height", "width", "color")
+    def request_redraw(self):
+        """Mark this widget and its ancestors dirty; the root will ask the ScreenManager to redraw the screen on the next frame.
+        """
+        self.is_dirty = True
+
+        if self.parent is not None:
+            self.parent.request_redraw()
 
     @staticmethod
     def convert(value, bounds):
@@ -454,6 +576,66 @@ class Widget(metaclass=Observer):
         except AttributeError:
             pass
 
+    def on_mouse(self, event):
+        """
+        Called with a :class: MouseEvent over this widget (or one of its descendants that didn't handle it).
+        An event is handled when a widget's `on_mouse` method returns True.
+        """
+        try:
+            return super().on_mouse(event)
+        except AttributeError:
+            pass
+
+    def on_attach(self, root):
+        """
+        Called when this widget (or an ancestor) is added to a tree with a root, e.g., to register with `root.focus`.
+        Widgets (and behaviors) that override this should call `super().on_attach(root)`.
+        """
+        try:
+            return super().on_attach(root)
+        except AttributeError:
+            pass
+
+    def on_detach(self, root):
+        """Called when this widget (or an ancestor) is removed from `root`'s tree; undo `on_attach` here.
+        """
+        try:
+            return super().on_detach(root)
+        except AttributeError:
+            pass
+
+    def widget_at(self, y, x):
+        """The deepest, topmost widget at `(y, x)` (relative to this widget), or this widget if no child is there.
+        """
+        widget = self
+        while True:
+            border = int(widget.has_border)
+            y -= border
+            x -= border
+
+            index = widget._spatial_index
+            if index is None or index.n_children != len(widget.children):  # Children changed behind our back.
+                index = widget._spatial_index = SpatialIndex(widget.children)
+
+            if (child := index.hit(y, x)) is None:
+                return widget
+
+            y -= child.top
+            x -= child.left
+            widget = child
+
+    def to_local(self, y, x):
+        """Convert screen coordinates to coordinates relative to this widget.
+        """
+        widget = self
+        while (parent := widget.parent) is not None:
+            border = int(parent.has_border)
+            y -= widget.top + border
+            x -= widget.left + border
+            widget = parent
+
+        return y, x
+
     def update_color(self, color):
         self.color = color
         self.window.attrset(color)
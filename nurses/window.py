@@ -0,0 +1,120 @@
+import numpy as np
+
+
+class Window:
+    """
+    :class: Window is a numpy-backed stand-in for a curses window.  Characters are stored in `chars` and curses attributes
+    (color pairs) in `colors`.  It implements the subset of the curses window api that nurses uses, so widgets can draw on
+    it as they would a curses window, but compositing a window into its parent's is just array slicing and nothing is
+    written to the terminal until the root widget presents the screen.
+
+    Notes
+    -----
+    Unlike curses, writes that fall outside the window are clipped instead of raising an error.
+
+    `overlay` treats cells holding `transparent_character` (a blank by default) as see-through unless `mask` is set: a
+    boolean array the shape of the window that is true where the window should be drawn.
+    """
+    __slots__ = "chars", "colors", "attr", "background", "mask", "transparent_character"
+
+    def __init__(self, height, width):
+        self.attr = 0
+        self.background = 0
+        self.mask = None
+        self.transparent_character = " "
+        self.chars = np.full((height, width), " ")
+        self.colors = np.full((height, width), self.background)
+
+    def getmaxyx(self):
+        return self.chars.shape
+
+    def attrset(self, attr):
+        self.attr = attr
+
+    def bkgd(self, ch, attr=0):
+        self.background = attr
+        self.colors[:] = attr
+
+    def erase(self):
+        self.chars[:] = " "
+        self.colors[:] = self.background
+
+    def resize(self, height, width):
+        old_h, old_w = self.chars.shape
+        min_h, min_w = min(height, old_h), min(width, old_w)
+
+        chars = np.full((height, width), " ")
+        chars[:min_h, :min_w] = self.chars[:min_h, :min_w]
+
+        colors = np.full((height, width), self.background)
+        colors[:min_h, :min_w] = self.colors[:min_h, :min_w]
+
+        self.chars = chars
+        self.colors = colors
+        self.mask = None
+
+    def addstr(self, y, x, text, attr=None):
+        """Write `text` at `(y, x)`.  Lines after a newline in `text` start at column 0 of the following rows.
+        """
+        if attr is None:
+            attr = self.attr
+
+        for i, line in enumerate(text.split("\n")):
+            if line:
+                self._set(y + i, x if i == 0 else 0, tuple(line), attr)
+
+    def hline(self, y, x, ch, n):
+        self._set(y, x, (ch,) * n, self.attr)
+
+    def chgat(self, y, x, *args):
+        """`chgat(y, x, attr)` or `chgat(y, x, num, attr)`: Change the attributes of `num` characters (or to the end of the line).
+        """
+        num, attr = args if len(args) == 2 else (-1, *args)
+        height, width = self.chars.shape
+
+        if 0 <= y < height and x < width:
+            self.colors[y, max(0, x): width if num == -1 else max(0, x + num)] = attr
+
+    def _set(self, y, x, chars, attr):
+        height, width = self.chars.shape
+
+        if not 0 <= y < height or x >= width or x + len(chars) <= 0:
+            return
+
+        start, end = max(0, -x), min(len(chars), width - x)
+        self.chars[y, x + start: x + end] = chars[start: end]
+        self.colors[y, x + start: x + end] = attr
+
+    def _copy(self, dest, sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol, transparent):
+        src_h, src_w = self.chars.shape
+        des_h, des_w = dest.chars.shape
+
+        height = min(dmaxrow - dminrow + 1, src_h - sminrow, des_h - dminrow)
+        width = min(dmaxcol - dmincol + 1, src_w - smincol, des_w - dmincol)
+
+        if height <= 0 or width <= 0:
+            return
+
+        source = slice(sminrow, sminrow + height), slice(smincol, smincol + width)
+        destination = slice(dminrow, dminrow + height), slice(dmincol, dmincol + width)
+
+        chars = self.chars[source]
+        if not transparent:
+            mask = True
+        elif self.mask is None:
+            mask = chars != self.transparent_character
+        else:
+            mask = self.mask[source]
+
+        np.copyto(dest.chars[destination], chars, where=mask)
+        np.copyto(dest.colors[destination], self.colors[source], where=mask)
+
+    def overlay(self, dest, sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol):
+        """Copy the given region of this window onto `dest`; `transparent_character`s (or cells outside of `mask`) are "see-through".
+        """
+        self._copy(dest, sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol, True)
+
+    def overwrite(self, dest, sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol):
+        """Copy the given region of this window onto `dest`.
+        """
+        self._copy(dest, sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol, False)
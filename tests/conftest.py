@@ -0,0 +1,14 @@
+import pytest
+
+from nurses import ScreenManager
+from nurses.backends import HeadlessBackend
+from nurses.managers.meta import Singleton
+
+
+@pytest.fixture
+def sm():
+    """A fresh ScreenManager on a 24x80 :class: HeadlessBackend."""
+    Singleton._instances.pop(ScreenManager, None)
+    screen_manager = ScreenManager(backend=HeadlessBackend(24, 80))
+    yield screen_manager
+    Singleton._instances.pop(ScreenManager, None)
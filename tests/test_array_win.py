@@ -0,0 +1,14 @@
+from nurses.widgets import ArrayPad, ArrayWin
+
+
+def test_reading_cells_doesnt_mark_the_widget_dirty(sm):
+    widget = sm.root.new_widget(0, 0, 3, 5, create_with=ArrayWin)
+    pad = sm.root.new_widget(3, 0, 3, 5, create_with=ArrayPad, rows=10, cols=10)
+    sm.root.refresh()
+
+    widget.buffer, widget.colors, widget.mask
+    pad.push()
+    assert not widget.is_dirty and not pad.is_dirty
+
+    widget[0] = "hello"
+    assert widget.is_dirty
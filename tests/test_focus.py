@@ -0,0 +1,64 @@
+from nurses import ESCAPE, F12, TAB
+from nurses.managers.meta import Singleton
+from nurses.managers import ScreenManager
+from nurses.builder import load_string
+from nurses.widgets import Grid, StatsOverlay, Widget
+from nurses.widgets.behaviors import Selectable
+
+
+class Field(Widget, Selectable):
+    pass
+
+
+def test_building_a_selectable_doesnt_create_the_screen_manager():
+    Singleton._instances.pop(ScreenManager, None)
+    Field(0, 0, 1, 1)
+    assert ScreenManager not in Singleton._instances
+
+
+def test_selectables_join_the_focus_chain_when_attached(sm):
+    first = sm.root.new_widget(0, 0, 1, 1, create_with=Field)
+    second = sm.root.new_widget(1, 0, 1, 1, create_with=Field)
+    sm.backend.feed(TAB, TAB, ESCAPE)
+    sm.run(until_exit=True)
+
+    assert sm.root.focus.focused is second
+    assert [widget_ref() for widget_ref in sm.root.focus.chain] == [first, second]
+
+
+def test_stats_overlay_toggles_while_a_widget_is_focused(sm):
+    field = sm.root.new_widget(0, 0, 1, 1, create_with=Field)
+    overlay = sm.root.new_widget(create_with=StatsOverlay)
+    sm.root.focus.set_focus(field)
+    sm.backend.feed(F12, ESCAPE)
+    sm.run(until_exit=True)
+
+    assert overlay.is_shown
+
+    sm.root.remove_widget(overlay)
+    assert F12 not in sm.root.focus.hotkeys
+
+
+def test_selectables_in_a_grid_join_the_focus_chain(sm):
+    grid = Grid(2, 2)
+    sm.root.add_widget(grid)
+    sm.root.refresh()
+    first = Field()
+    grid.add_widget(first)
+    second = Field()
+    grid.add_widget(second, 1, 1)
+    assert grid.is_dirty
+
+    sm.backend.feed(TAB, TAB, ESCAPE)
+    sm.run(until_exit=True)
+
+    assert sm.root.focus.focused is second
+
+
+def test_building_a_partly_filled_grid(sm):
+    widgets = load_string("""
+Grid(2, 2)
+    Field() as field
+""", {"Field": Field})
+
+    assert widgets["field"] in [widget_ref() for widget_ref in sm.root.focus.chain]
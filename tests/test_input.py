@@ -0,0 +1,74 @@
+from nurses import ENTER, ESCAPE, Paste
+from nurses.mouse import MouseEvent, PRESS, RELEASE, CLICK
+from nurses.widgets import Textbox, Widget
+
+
+class Recorder(Widget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys = [ ]
+        self.mouse_events = [ ]
+
+    def on_press(self, key):
+        self.keys.append(key)
+
+    def on_mouse(self, event):
+        self.mouse_events.append(event.type)
+        return True
+
+
+def test_on_press_never_sees_mouse_events(sm):
+    recorder = sm.root.new_widget(0, 0, 5, 5, create_with=Recorder)
+    sm.backend.feed_mouse(MouseEvent(PRESS, 1, 1, 1), MouseEvent(RELEASE, 1, 1, 1))
+    sm.backend.feed("q", ESCAPE)
+    sm.run(until_exit=True)
+
+    assert not any(isinstance(key, MouseEvent) for key in recorder.keys)
+    assert recorder.keys == [ord("q")]
+    assert recorder.mouse_events == [PRESS, RELEASE, CLICK]
+
+
+class Typist(Widget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys = [ ]
+
+    def on_press(self, key):
+        self.keys.append(key)
+        return True
+
+
+def test_paste_start_split_between_reads_isnt_exit(sm):
+    typist = sm.root.new_widget(0, 0, 5, 5, create_with=Typist)
+    sm.backend.feed("a", ESCAPE)  # The first read ends in the middle of ESC [200~
+
+    async def rest_of_paste():
+        await sm.next_task()
+        await sm.next_task()
+        sm.backend.feed(*"[200~pasted\033[201~", ESCAPE)
+
+    sm.run(rest_of_paste(), until_exit=True)
+
+    assert typist.keys == [ord("a"), Paste("pasted")]
+
+
+def test_lone_escape_still_exits(sm):
+    sm.backend.feed(ESCAPE)
+    sm.run(until_exit=True)  # Returns once the held escape times out and is dispatched as EXIT
+
+
+def test_gather_runs_to_completion(sm):
+    textbox = sm.root.new_widget(0, 0, 10, create_with=Textbox)
+    result = [ ]
+
+    async def ask():
+        result.append(await textbox.gather())
+
+    async def type_later():
+        await sm.sleep(.1)  # Long enough for the frame clock to park too.
+        sm.backend.feed(*"hi", ENTER)
+
+    sm.run(ask(), type_later())
+
+    assert result == ["hi"]
+    assert sm.count_tasks() == (0, 0)
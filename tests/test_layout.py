@@ -0,0 +1,13 @@
+from nurses.widgets import ArrayWin, Grid
+
+
+def test_resizing_a_partly_filled_grid(sm):
+    grid = Grid(2, 2)
+    sm.root.add_widget(grid)
+    widget = ArrayWin()
+    grid.add_widget(widget)
+
+    sm.root.update_geometry()
+
+    assert list(sm.root.walk()) == [widget, grid, sm.root]
+    assert (widget.height, widget.width) == (sm.root.height // 2, sm.root.width // 2)
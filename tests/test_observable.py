@@ -0,0 +1,55 @@
+from nurses.observable import Observable
+from nurses.widgets import Widget
+
+
+class Counter(Widget):
+    redraws = 0
+
+    def request_redraw(self):
+        self.redraws += 1
+        super().request_redraw()
+
+
+class Gauge(Counter):
+    value = Observable(0)
+
+
+Gauge.value.bind(Gauge, "request_redraw")  # An observable declared below the class whose method it calls.
+
+
+def test_methods_patched_onto_instances_are_called(sm):
+    widget = sm.root.new_widget(0, 0, 5, 5, create_with=Counter)
+    other = sm.root.new_widget(0, 0, 5, 5, create_with=Counter)
+    widget.height = 4  # Compile the dispatch table before patching.
+    widget.redraws = other.redraws = 0
+
+    calls = [ ]
+    widget.request_redraw = lambda: calls.append(widget.height)
+    widget.height = 3
+    other.height = 3
+
+    assert calls and set(calls) == {3}
+    assert widget.redraws == 0
+    assert other.redraws
+
+
+def test_patching_a_base_class_invalidates_subclasses_tables(sm):
+    widget = sm.root.new_widget(0, 0, 5, 5, create_with=Gauge)
+    widget.value = 1  # Compile `Gauge`'s dispatch table with the original method.
+    widget.redraws = 0
+
+    original = Counter.request_redraw
+    calls = [ ]
+
+    def request_redraw(self):
+        calls.append(self.value)
+        original(self)
+
+    Counter.request_redraw = request_redraw
+    try:
+        widget.value = 2
+    finally:
+        Counter.request_redraw = original
+
+    assert calls == [2]
+    assert widget.redraws == 1
@@ -0,0 +1,96 @@
+import gc
+import os
+import select
+from time import monotonic
+import warnings
+
+import pytest
+
+from nurses.managers.scheduler import Scheduler
+
+
+def test_schedule_returns_a_task_compatible_handle():
+    scheduler = Scheduler()
+    calls = [ ]
+    callback = scheduler.schedule(lambda: calls.append(1) or len(calls), n=3)
+    scheduler.run()
+
+    assert calls == [1, 1, 1]
+    assert callback.result == 3
+
+    callback.cancel(close=True)
+    with pytest.raises(RuntimeError):
+        callback()
+
+
+def test_scheduling_outside_the_loop_creates_no_coroutine():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        scheduler = Scheduler()
+        scheduler.schedule(print, delay=1)
+        del scheduler
+        gc.collect()
+
+    assert not caught
+
+
+def test_late_group_member_starts_on_its_own_schedule():
+    scheduler = Scheduler()
+    start = monotonic()
+    early, late = [ ], [ ]
+
+    async def join_later():
+        await scheduler.sleep(.03)
+        scheduler.schedule(lambda: late.append(monotonic() - start), delay=.1, n=2)
+
+    scheduler.schedule(lambda: early.append(monotonic() - start), delay=.1, n=2)
+    scheduler.run(join_later())
+
+    first, second = late
+    assert first < .07  # Called as soon as it was scheduled, not on the early group's next tick at .1
+    assert .09 <= second - first < .15
+
+
+def test_timers_dont_wake_file_descriptor_waiters():
+    scheduler = Scheduler()
+    scheduler.io_timeout = .1
+    read_fd, write_fd = os.pipe()
+    wakeups = [ ]
+
+    async def reader():
+        while not select.select([read_fd], [ ], [ ], 0)[0]:
+            await scheduler.wait_readable(read_fd)
+            wakeups.append(monotonic())
+
+    async def frames():
+        for _ in range(18):
+            await scheduler.sleep(1 / 60)
+        os.write(write_fd, b"x")
+
+    try:
+        scheduler.run(reader(), frames())
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+    assert len(wakeups) <= 5  # About .3 seconds: two or three `io_timeout`s and the write, not one per frame.
+
+
+def test_task_that_cancels_itself_then_sleeps_isnt_counted():
+    scheduler = Scheduler()
+    counts = [ ]
+
+    async def quitter():
+        scheduler.current.cancel()
+        await scheduler.sleep(.01)
+
+    async def counter():
+        await scheduler.next_task()
+        counts.append(scheduler.count_tasks())
+        await scheduler.sleep(.03)  # Past the quitter's deadline.
+        counts.append(scheduler.count_tasks())
+
+    scheduler.run(quitter(), counter())
+
+    assert counts == [(0, 0), (0, 0)]
+    assert scheduler.sleeping.dead == 0